@@ -7,6 +7,7 @@ Use only for authorized testing scopes.
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import asdict
 from typing import Any, Dict, Mapping, Optional
 
@@ -23,7 +24,9 @@ class AgenticPentestRunner:
     """Orchestrates pentest execution and optional AI-agent analysis."""
 
     def __init__(self, tester: Optional[PenetrationTester] = None) -> None:
-        self.tester = tester or PenetrationTester()
+        # A caller-supplied tester is left open; otherwise each run() opens
+        # and closes its own.
+        self.tester = tester
 
     def run(
         self,
@@ -45,24 +48,25 @@ class AgenticPentestRunner:
         """
         Run SQLi + XSS + baseline comparison tests, then optional agentic AI analysis.
         """
-        sqli_results = self.tester.send_sqli_payloads(
-            url=url,
-            params=params,
-            method=method,
-            headers=headers,
-        )
-
-        time_results = []
-        if enable_time_based:
-            time_results = self.tester.detect_time_based_blind_sqli(
+        with nullcontext(self.tester) if self.tester else PenetrationTester() as tester:
+            sqli_results = tester.send_sqli_payloads(
                 url=url,
                 params=params,
                 method=method,
                 headers=headers,
-                retries=time_retries,
-                min_delay_delta=min_delay_delta,
             )
 
+            time_results = []
+            if enable_time_based:
+                time_results = tester.detect_time_based_blind_sqli(
+                    url=url,
+                    params=params,
+                    method=method,
+                    headers=headers,
+                    retries=time_retries,
+                    min_delay_delta=min_delay_delta,
+                )
+
         findings = self._normalize_findings(url=url, sqli_results=sqli_results, time_results=time_results)
 
         threat_intel = self._load_threat_intel(
@@ -261,6 +265,9 @@ class AgenticPentestRunner:
                             "payload": item.payload,
                             "baseline_avg": item.average_baseline_time,
                             "injected_avg": item.average_injected_time,
+                            "baseline_median": item.median_baseline_time,
+                            "injected_median": item.median_injected_time,
+                            "injected_samples": item.samples,
                             "delay_delta": item.delay_delta,
                         },
                         "cwe_id": "CWE-89",
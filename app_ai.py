@@ -562,8 +562,8 @@ for k, v in {
 
 # ── LANDING PAGE ──────────────────────────────────────────────────────────────
 if st.session_state.page == 'landing' and not st.session_state.authenticated:
-    navigated = show_landing_page()
-    if navigated:
+    landing = show_landing_page()
+    if landing.clicked:
         st.session_state.page = 'login'
         st.session_state.direct_login_attempt = False
         st.rerun()
@@ -3,14 +3,54 @@ landing_page.py
 Ultra-premium redesign — Deep Space Neon Cybersecurity Theme.
 Electric cyan + violet + magenta palette on near-black background.
 Enhanced with advanced animations, particle effects, and visual depth.
-Returns True when any primary CTA is clicked.
+Returns a LandingEvent recording which primary CTA (if any) was clicked.
 """
+import re
+from datetime import date
+from typing import NamedTuple
+
 import streamlit as st
 
+
+class LandingEvent(NamedTuple):
+    """Click state of the landing page's three launch buttons."""
+    nav: bool
+    hero: bool
+    cta: bool
+
+    @property
+    def clicked(self) -> bool:
+        return self.nav or self.hero or self.cta
+
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a <style> block."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE.sub(" ", css)
+    css = _CSS_PUNCT.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+_HTML_GAP = re.compile(r">\s*\n\s*<")
+_HTML_BREAK = re.compile(r"\s*\n\s*")
+
+
+def _minify_html(html: str) -> str:
+    """Drop the source indentation and line breaks from an HTML block."""
+    html = _HTML_GAP.sub("><", html)
+    return _HTML_BREAK.sub(" ", html).strip()
+
+
 LANDING_CSS = """
 <style>
-@import url('https://fonts.googleapis.com/css2?family=Syne:wght@400;500;600;700;800&family=DM+Mono:wght@300;400;500&family=Cabinet+Grotesk:wght@400;500;700;800;900&display=swap');
-@import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&family=JetBrains+Mono:wght@300;400;500&display=swap');
+/* Same font URL as the global theme in app_ai.py, so the browser reuses
+   that stylesheet instead of fetching a second family set. */
+@import url('https://fonts.googleapis.com/css2?family=Syne:wght@400;500;600;700;800&family=Space+Grotesk:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap');
 
 /* ══ RESET & FORCE DARK ══ */
 html, body,
@@ -95,41 +135,43 @@ html, body,
     50%  { opacity: .9; transform: scale(1.03) rotate(.5deg); }
     100% { opacity: 1;  transform: scale(1.06) rotate(1deg); }
 }
-.bg-canvas::after {
-    content: '';
-    position: fixed; inset: 0;
-    background-image:
-        radial-gradient(circle, rgba(0,212,255,.15) 1px, transparent 1px),
-        radial-gradient(circle, rgba(168,85,247,.08) 1px, transparent 1px);
-    background-size: 48px 48px, 96px 96px;
-    background-position: 0 0, 24px 24px;
+.bg-grid {
+    position: fixed; inset: 0; overflow: hidden;
     mask-image: radial-gradient(ellipse 100% 100% at 50% 50%, black 20%, transparent 80%);
-    animation: gridDrift 24s linear infinite;
 }
-@keyframes gridDrift {
-    from { background-position: 0 0, 24px 24px; }
-    to   { background-position: 48px 48px, 72px 72px; }
+/* Dot grid: one pre-drawn 96px SVG tile (cyan dots every 48px, violet every
+   96px) drifting on a transform, so the masked layer above stays put and
+   nothing repaints per frame. */
+.bg-grid::before {
+    content: '';
+    position: absolute; top: -96px; left: -96px; right: 0; bottom: 0;
+    background: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='96' height='96'%3E%3Cg fill='%2300d4ff' fill-opacity='.15'%3E%3Ccircle cx='24' cy='24' r='1'/%3E%3Ccircle cx='72' cy='24' r='1'/%3E%3Ccircle cx='24' cy='72' r='1'/%3E%3Ccircle cx='72' cy='72' r='1'/%3E%3C/g%3E%3Ccircle cx='72' cy='72' r='1' fill='%23a855f7' fill-opacity='.08'/%3E%3C/svg%3E");
+    background-size: 96px 96px;
+    animation: gridDrift 48s linear infinite;
+    will-change: transform;
 }
+@keyframes gridDrift { to { transform: translate3d(96px, 96px, 0); } }
 
 /* Horizontal scan lines — multiple */
 .scan-beam {
     position: fixed; left: 0; right: 0; height: 2px; z-index: 0; pointer-events: none;
-    background: linear-gradient(90deg, transparent 0%, rgba(0,212,255,.7) 30%, rgba(168,85,247,.7) 60%, rgba(232,121,249,.4) 80%, transparent 100%);
+    background: linear-gradient(90deg, transparent 0%, rgba(0,212,255,.7) 30%, rgba(168,85,247,.7) 60%, var(--mag-glow) 80%, transparent 100%);
     filter: blur(1px);
     animation: scanBeam 10s ease-in-out infinite;
-    top: 0;
+    top: 0; will-change: transform, opacity;
 }
 .scan-beam-2 {
     position: fixed; left: 0; right: 0; height: 1px; z-index: 0; pointer-events: none;
     background: linear-gradient(90deg, transparent 0%, rgba(52,211,153,.5) 50%, transparent 100%);
     animation: scanBeam 10s 5s ease-in-out infinite;
-    top: 0;
+    top: 0; will-change: transform, opacity;
 }
+/* Moved with transform rather than top so the sweep never triggers layout */
 @keyframes scanBeam {
-    0%   { top: -2px; opacity: 0; }
+    0%   { transform: translateY(-2px); opacity: 0; }
     3%   { opacity: 1; }
     97%  { opacity: .4; }
-    100% { top: 102%; opacity: 0; }
+    100% { transform: translateY(102vh); opacity: 0; }
 }
 
 /* ── Floating hex shapes ── */
@@ -157,13 +199,25 @@ html, body,
 /* ══ WRAPPER ══ */
 .lp { position: relative; z-index: 1; }
 
+/* ══ GRADIENT TEXT ══
+   Shared clip for every gradient-filled label; each selector below only
+   sets its own background-image. */
+.grad-text,
+.nav-logo-icon, .brand-logo-icon,
+.nav-wordmark em, .brand-wordmark em,
+.hero-h1 .grad, .stat-value, .sec-title .g, .step-number,
+.trust-num, .cta-title .g, .footer-copy-sig {
+    -webkit-background-clip: text; background-clip: text;
+    -webkit-text-fill-color: transparent;
+}
+.grad-text { background-image: linear-gradient(135deg, var(--cyan), var(--violet)); }
+
 /* ══════════════════════════════════════
    NAVBAR — frosted glass with glow edge
 ══════════════════════════════════════ */
 .navbar {
     position: sticky; top: 0; z-index: 200;
-    background: rgba(2,2,10,.75);
-    backdrop-filter: blur(40px) saturate(2) brightness(1.1);
+    background: rgba(2,2,10,.92);
     border-bottom: 1px solid rgba(0,212,255,.1);
     padding: 0 48px;
     box-shadow: 0 1px 0 rgba(0,212,255,.08), 0 4px 32px rgba(0,0,0,.4);
@@ -187,15 +241,14 @@ html, body,
     position: absolute; inset: -3px; border-radius: 13px;
     background: conic-gradient(from 0deg, transparent 0%, var(--cyan-dim) 30%, transparent 60%);
     animation: spinGlow 4s linear infinite;
+    will-change: transform; contain: strict;
     mask: radial-gradient(farthest-side, transparent calc(100% - 2px), white calc(100% - 2px));
     opacity: .6;
 }
 @keyframes spinGlow { to { transform: rotate(360deg); } }
 .nav-logo-icon, .brand-logo-icon {
     font-size: 1.1rem; position: relative; z-index: 1;
-    background: linear-gradient(135deg, var(--cyan), var(--violet));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(135deg, var(--cyan), var(--violet));
     filter: drop-shadow(0 0 8px var(--cyan-glow));
 }
 .nav-wordmark, .brand-wordmark {
@@ -207,9 +260,7 @@ html, body,
 }
 .nav-wordmark em, .brand-wordmark em {
     font-style: normal;
-    background: linear-gradient(90deg, var(--cyan), var(--violet));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(90deg, var(--cyan), var(--violet));
     filter: drop-shadow(0 0 12px rgba(0,212,255,.4));
 }
 .nav-brand-stack {
@@ -264,18 +315,6 @@ html, body,
 /* ══════════════════════════════════════
    HERO
 ══════════════════════════════════════ */
-.hero-outer {
-    position: relative; overflow: hidden;
-}
-/* Diagonal accent line */
-.hero-outer::before {
-    content: '';
-    position: absolute; top: -100px; right: -100px;
-    width: 600px; height: 600px;
-    border-radius: 50%;
-    background: radial-gradient(circle, rgba(168,85,247,.07) 0%, transparent 70%);
-    pointer-events: none;
-}
 .hero-section {
     max-width: 1320px; margin: 0 auto;
     padding: 88px 48px 64px;
@@ -294,7 +333,7 @@ html, body,
     font-family: var(--font-mono); font-size: .63rem;
     letter-spacing: .16em; color: var(--cyan);
     margin-bottom: 30px;
-    opacity: 0; animation: slideUp .7s .1s ease forwards;
+    animation: slideUp .7s .1s ease both;
     position: relative; overflow: hidden;
 }
 .hero-badge::before {
@@ -322,15 +361,20 @@ html, body,
     color: var(--text-1);
     letter-spacing: -.04em;
     margin-bottom: 10px;
-    opacity: 0; animation: slideUp .7s .2s ease forwards;
+    animation: slideUp .7s .2s ease both;
 }
 .hero-h1 .grad {
-    background: linear-gradient(135deg, var(--cyan) 0%, var(--violet) 45%, var(--mag-bright) 100%);
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
-    filter: drop-shadow(0 0 20px rgba(0,212,255,.25));
+    background-image: linear-gradient(135deg, var(--cyan) 0%, var(--violet) 45%, var(--mag-bright) 100%);
     position: relative; display: inline-block;
 }
+/* Glow: a text-shadowed copy (from data-text) painted behind the gradient.
+   Cheaper than filter: drop-shadow, which needs an offscreen pass. */
+.hero-h1 .grad::before {
+    content: attr(data-text);
+    position: absolute; inset: 0; z-index: -1;
+    text-shadow: 0 0 20px rgba(0,212,255,.25);
+    pointer-events: none;
+}
 /* Underline glow on gradient text */
 .hero-h1 .grad::after {
     content: '';
@@ -348,25 +392,25 @@ html, body,
     font-size: clamp(1.1rem, 2vw, 1.65rem);
     font-weight: 400; color: var(--text-2);
     letter-spacing: -.01em; margin-bottom: 26px;
-    opacity: 0; animation: slideUp .7s .3s ease forwards;
+    animation: slideUp .7s .3s ease both;
 }
 .hero-desc {
     font-size: .9rem; color: var(--text-2);
     line-height: 1.85; margin-bottom: 38px;
-    opacity: 0; animation: slideUp .7s .4s ease forwards;
+    animation: slideUp .7s .4s ease both;
     max-width: 540px;
-    border-left: 2px solid rgba(0,212,255,.2);
+    border-left: 2px solid var(--border-c);
     padding-left: 16px;
 }
 .hero-actions {
     display: flex; gap: 14px; flex-wrap: wrap;
-    opacity: 0; animation: slideUp .7s .5s ease forwards;
+    animation: slideUp .7s .5s ease both;
 }
 
 /* Stats row */
 .hero-stats {
     display: flex; gap: 36px; margin-top: 48px;
-    opacity: 0; animation: slideUp .7s .65s ease forwards;
+    animation: slideUp .7s .65s ease both;
     border-top: 1px solid rgba(0,212,255,.1);
     padding-top: 32px;
     position: relative;
@@ -380,9 +424,7 @@ html, body,
 .stat-value {
     font-family: var(--font-display);
     font-size: 2.2rem; font-weight: 800;
-    background: linear-gradient(135deg, var(--cyan), var(--violet));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(135deg, var(--cyan), var(--violet));
     line-height: 1; display: block;
     filter: drop-shadow(0 0 8px rgba(0,212,255,.2));
 }
@@ -395,7 +437,7 @@ html, body,
 
 /* ══ HERO RIGHT: Live Terminal ══ */
 .term-wrap {
-    opacity: 0; animation: slideUp .7s .45s ease forwards;
+    animation: slideUp .7s .45s ease both;
     position: relative;
 }
 /* Glow behind terminal */
@@ -427,7 +469,7 @@ html, body,
     content: '';
     position: absolute; top: 0; left: 0; right: 0; height: 2px;
     background: linear-gradient(90deg, transparent 5%, var(--cyan-dim) 35%, var(--violet) 65%, transparent 95%);
-    box-shadow: 0 0 20px rgba(0,212,255,.5);
+    box-shadow: 0 0 20px var(--cyan-glow);
     z-index: 2;
 }
 /* Corner accents */
@@ -474,24 +516,19 @@ html, body,
     display: flex; align-items: flex-start; gap: 10px;
     margin-bottom: 11px;
     font-family: var(--font-mono); font-size: .76rem;
-    opacity: 0; animation: termLine .4s ease forwards;
+    animation: termLine .4s ease both;
+    /* each line carries its position as --i in the markup */
+    animation-delay: calc(1s + var(--i, 0) * .8s);
     position: relative;
 }
 /* Line highlight on last active */
 .t-line:last-child { background: rgba(0,212,255,.02); border-radius: 4px; }
-.t-line:nth-child(1) { animation-delay: 1.0s; }
-.t-line:nth-child(2) { animation-delay: 1.8s; }
-.t-line:nth-child(3) { animation-delay: 2.6s; }
-.t-line:nth-child(4) { animation-delay: 3.4s; }
-.t-line:nth-child(5) { animation-delay: 4.2s; }
-.t-line:nth-child(6) { animation-delay: 5.0s; }
-.t-line:nth-child(7) { animation-delay: 5.8s; }
-.t-line:nth-child(8) { animation-delay: 6.6s; }
 @keyframes termLine {
     from { opacity:0; transform: translateX(-8px); }
     to   { opacity:1; transform: translateX(0); }
 }
-.t-prompt { color: var(--cyan-dim); flex-shrink: 0; font-weight: 500; }
+/* Prompt glyph drawn by CSS rather than a span per line */
+.t-line::before { content: '›'; color: var(--cyan-dim); flex-shrink: 0; font-weight: 500; }
 .t-mute   { color: var(--text-3); }
 .t-ok     { color: var(--green); }
 .t-warn   { color: var(--amber); }
@@ -517,8 +554,9 @@ html, body,
     background: linear-gradient(90deg, var(--cyan-dim), var(--violet), var(--mag-bright));
     border-radius: 3px;
     box-shadow: 0 0 12px var(--cyan-glow), 0 0 24px rgba(168,85,247,.3);
-    animation: progFill 4.5s 1.5s ease forwards;
-    width: 0%;
+    animation: progFill 4.5s 1.5s ease both;
+    width: 100%;
+    transform: scaleX(.87); transform-origin: left;
     position: relative;
 }
 .t-progress-fill::after {
@@ -528,7 +566,7 @@ html, body,
     border-radius: 2px;
     filter: blur(3px);
 }
-@keyframes progFill { to { width: 87%; } }
+@keyframes progFill { from { transform: scaleX(0); } }
 
 /* ── Terminal severity badges ── */
 .t-badge {
@@ -551,14 +589,18 @@ div[data-testid="stButton"] > button {
     font-size: .8rem !important;
     font-weight: 700 !important;
     letter-spacing: .06em !important;
-    transition: all .35s cubic-bezier(.23,1,.32,1) !important;
+    transition: transform .35s cubic-bezier(.23,1,.32,1), box-shadow .35s cubic-bezier(.23,1,.32,1),
+                border-color .35s, color .2s !important;
     white-space: nowrap !important;
     text-transform: uppercase !important;
     position: relative !important;
     overflow: hidden !important;
 }
-/* PRIMARY — gradient with animated shine */
-div[data-testid="stButton"].btn-primary > button {
+/* PRIMARY — gradient with animated shine.
+   Streamlit (1.39+) tags each keyed widget's container with `st-key-<key>`. */
+.st-key-nav_launch button,
+.st-key-hero_launch button,
+.st-key-cta_launch button {
     background: linear-gradient(135deg, var(--cyan-dim) 0%, var(--violet-dim) 60%, var(--mag-bright) 100%) !important;
     color: #fff !important;
     border: none !important;
@@ -567,7 +609,9 @@ div[data-testid="stButton"].btn-primary > button {
         0 0 0 1px rgba(255,255,255,.12) inset,
         0 0 40px rgba(0,212,255,.15) !important;
 }
-div[data-testid="stButton"].btn-primary > button::before {
+.st-key-nav_launch button::before,
+.st-key-hero_launch button::before,
+.st-key-cta_launch button::before {
     content: '' !important;
     position: absolute !important;
     top: 0 !important; left: -100% !important;
@@ -581,31 +625,20 @@ div[data-testid="stButton"].btn-primary > button::before {
     40%  { left: 150%; }
     100% { left: 150%; }
 }
-div[data-testid="stButton"].btn-primary > button:hover {
+.st-key-nav_launch button:hover,
+.st-key-hero_launch button:hover,
+.st-key-cta_launch button:hover {
     transform: translateY(-4px) scale(1.03) !important;
     box-shadow:
         0 20px 56px rgba(168,85,247,.6),
         0 0 40px rgba(0,212,255,.35),
         0 0 80px rgba(232,121,249,.15) !important;
 }
-div[data-testid="stButton"].btn-primary > button:active {
+.st-key-nav_launch button:active,
+.st-key-hero_launch button:active,
+.st-key-cta_launch button:active {
     transform: translateY(1px) scale(.98) !important;
 }
-/* GHOST */
-div[data-testid="stButton"].btn-ghost > button {
-    background: rgba(255,255,255,.03) !important;
-    color: var(--text-1) !important;
-    border: 1px solid rgba(255,255,255,.1) !important;
-    box-shadow: none !important;
-    text-transform: uppercase !important;
-}
-div[data-testid="stButton"].btn-ghost > button:hover {
-    border-color: rgba(0,212,255,.45) !important;
-    color: var(--cyan) !important;
-    background: rgba(0,212,255,.06) !important;
-    box-shadow: 0 8px 28px rgba(0,212,255,.1), 0 0 0 1px rgba(0,212,255,.15) inset !important;
-    transform: translateY(-2px) !important;
-}
 
 /* ══════════════════════════════════════
    SECTION SHARED
@@ -633,9 +666,7 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     margin-bottom: 14px;
 }
 .sec-title .g {
-    background: linear-gradient(135deg, var(--cyan-dim), var(--violet));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(135deg, var(--cyan-dim), var(--violet));
 }
 .sec-sub {
     font-size: .9rem; color: var(--text-2); line-height: 1.7;
@@ -648,6 +679,9 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     padding: 104px 0;
     background: linear-gradient(180deg, #02020a 0%, #06060f 40%, #0a0a18 60%, #02020a 100%);
     position: relative;
+    /* below the fold — skip layout/paint until scrolled near */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 1000px;
 }
 .feats-sec::before {
     content: '';
@@ -660,31 +694,34 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     background: linear-gradient(90deg, transparent 5%, rgba(168,85,247,.2) 50%, transparent 95%);
 }
 .feats-grid {
-    display: grid;
-    grid-template-columns: repeat(3, 1fr);
+    display: flex; flex-wrap: wrap;
     gap: 16px;
 }
+/* Three per row at most; min-width decides when a row drops to two or one */
+.feats-grid > * { flex: 1 1 calc((100% - 32px) / 3); min-width: 280px; }
 .feat-card {
     background: var(--bg-card);
     border: 1px solid var(--border);
     border-radius: var(--radius-lg);
     padding: 30px 26px;
     position: relative; overflow: hidden;
-    transition: all .45s cubic-bezier(.23,1,.32,1);
+    contain: layout style paint;
+    transition: transform .45s cubic-bezier(.23,1,.32,1), box-shadow .45s cubic-bezier(.23,1,.32,1),
+                border-color .45s, background-color .45s;
     cursor: default;
 }
 /* Animated corner accent */
 .feat-card::before {
     content: '';
     position: absolute; top: 0; left: 0; right: 0; height: 1px;
-    background: linear-gradient(90deg, transparent, rgba(0,212,255,.5), transparent);
+    background: linear-gradient(90deg, transparent, var(--cyan-glow), transparent);
     opacity: 0; transition: opacity .4s;
     box-shadow: 0 0 20px rgba(0,212,255,.3);
 }
 .feat-card::after {
     content: '';
     position: absolute; inset: 0;
-    background: radial-gradient(ellipse 70% 70% at 50% -20%, rgba(0,212,255,.04), transparent);
+    background: radial-gradient(ellipse 70% 70% at 50% -20%, rgba(0,212,255,.07), transparent);
     opacity: 0; transition: opacity .4s;
 }
 /* Left border accent that fills on hover */
@@ -697,7 +734,8 @@ div[data-testid="stButton"].btn-ghost > button:hover {
 .feat-card:hover {
     border-color: rgba(0,212,255,.25);
     transform: translateY(-8px) scale(1.01);
-    box-shadow: 0 28px 70px rgba(0,0,0,.55), 0 0 50px rgba(0,212,255,.05);
+    will-change: transform, box-shadow;
+    box-shadow: 0 28px 70px rgba(0,0,0,.55);
     background: var(--bg-card-hover);
 }
 .feat-card:hover::before { opacity: 1; }
@@ -715,7 +753,7 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     background: linear-gradient(135deg, rgba(0,212,255,.08), rgba(168,85,247,.08));
     display: flex; align-items: center; justify-content: center;
     margin-bottom: 18px;
-    transition: all .4s;
+    transition: transform .4s, box-shadow .4s, border-color .4s;
     font-size: 1.4rem;
     position: relative;
 }
@@ -788,6 +826,9 @@ div[data-testid="stButton"].btn-ghost > button:hover {
 .how-sec {
     padding: 104px 0;
     position: relative;
+    /* below the fold — skip layout/paint until scrolled near */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 680px;
 }
 .how-sec::before {
     content: '';
@@ -804,7 +845,9 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     border-radius: var(--radius-lg);
     padding: 40px 30px;
     text-align: center;
-    transition: all .45s cubic-bezier(.23,1,.32,1);
+    contain: layout style paint;
+    transition: transform .45s cubic-bezier(.23,1,.32,1), box-shadow .45s cubic-bezier(.23,1,.32,1),
+                border-color .45s, background-color .45s;
     position: relative; overflow: hidden;
 }
 .step-card::before {
@@ -823,7 +866,8 @@ div[data-testid="stButton"].btn-ghost > button:hover {
 .step-card:hover {
     border-color: rgba(168,85,247,.3);
     transform: translateY(-8px);
-    box-shadow: 0 24px 60px rgba(0,0,0,.55), 0 0 40px rgba(168,85,247,.06);
+    will-change: transform, box-shadow;
+    box-shadow: 0 24px 60px rgba(0,0,0,.55);
     background: var(--bg-card-hover);
 }
 .step-card:hover::before { opacity: 1; }
@@ -832,15 +876,12 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     font-family: var(--font-display);
     font-size: 4.5rem; font-weight: 900;
     line-height: 1;
-    background: linear-gradient(135deg, rgba(0,212,255,.18), rgba(168,85,247,.12));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(135deg, rgba(0,212,255,.18), rgba(168,85,247,.12));
     margin-bottom: 16px; display: block;
-    transition: all .4s;
+    transition: filter .4s;
 }
 .step-card:hover .step-number {
-    background: linear-gradient(135deg, rgba(0,212,255,.5), rgba(168,85,247,.4));
-    -webkit-background-clip: text; background-clip: text;
+    background-image: linear-gradient(135deg, var(--cyan-glow), rgba(168,85,247,.4));
     filter: drop-shadow(0 0 20px rgba(0,212,255,.2));
 }
 .step-icon {
@@ -875,7 +916,7 @@ div[data-testid="stButton"].btn-ghost > button:hover {
 }
 @keyframes connPulse {
     0%, 100% { opacity: .5; box-shadow: 0 0 8px rgba(0,212,255,.2); }
-    50%       { opacity: 1; box-shadow: 0 0 20px rgba(0,212,255,.5); }
+    50%       { opacity: 1; box-shadow: 0 0 20px var(--cyan-glow); }
 }
 
 /* ══════════════════════════════════════
@@ -892,9 +933,10 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     position: relative;
 }
 .trust-grid {
-    display: grid; grid-template-columns: repeat(4, 1fr);
+    display: flex; flex-wrap: wrap;
     gap: 32px; text-align: center;
 }
+.trust-grid > * { flex: 1 1 calc((100% - 96px) / 4); min-width: 160px; }
 .trust-item {
     position: relative; padding: 16px;
     border-right: 1px solid rgba(255,255,255,.05);
@@ -905,9 +947,7 @@ div[data-testid="stButton"].btn-ghost > button:hover {
 .trust-num {
     font-family: var(--font-display);
     font-size: 2.8rem; font-weight: 900;
-    background: linear-gradient(135deg, var(--cyan), var(--violet));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(135deg, var(--cyan), var(--violet));
     display: block; line-height: 1;
     filter: drop-shadow(0 0 12px rgba(0,212,255,.2));
 }
@@ -918,12 +958,247 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     display: block;
 }
 
+/* ══════════════════════════════════════
+   ANIMATIONS
+══════════════════════════════════════ */
+@keyframes slideUp {
+    from { opacity:0; transform:translateY(32px); }
+    to   { opacity:1; transform:translateY(0); }
+}
+
+/* ══════════════════════════════════════
+   GLITCH TEXT EFFECT (on hover)
+══════════════════════════════════════ */
+.glitch {
+    position: relative;
+}
+.glitch:hover::before,
+.glitch:hover::after {
+    content: attr(data-text);
+    position: absolute; top: 0; left: 0;
+    width: 100%; height: 100%;
+    background: transparent;
+    -webkit-background-clip: text; background-clip: text;
+}
+.glitch:hover::before {
+    color: var(--cyan); opacity: .7;
+    animation: glitchTop .4s steps(2) infinite;
+    clip-path: polygon(0 0, 100% 0, 100% 40%, 0 40%);
+}
+.glitch:hover::after {
+    color: var(--mag-bright); opacity: .7;
+    animation: glitchBot .4s steps(2) infinite;
+    clip-path: polygon(0 60%, 100% 60%, 100% 100%, 0 100%);
+}
+@keyframes glitchTop {
+    0%   { transform: translate(-2px, -1px); }
+    50%  { transform: translate(2px, 1px); }
+    100% { transform: translate(-1px, 2px); }
+}
+@keyframes glitchBot {
+    0%   { transform: translate(2px, 1px); }
+    50%  { transform: translate(-2px, -1px); }
+    100% { transform: translate(1px, -2px); }
+}
+
+/* ══════════════════════════════════════
+   RESPONSIVE
+══════════════════════════════════════ */
+@media (max-width: 1100px) {
+    .hero-section  { grid-template-columns: 1fr; gap:48px; padding:64px 32px 48px; }
+    .steps-row     { grid-template-columns: 1fr; gap:16px; }
+    .step-connector{ display:none; }
+    .nav-center-links { display:none; }
+}
+@media (max-width: 768px) {
+    .block-container { padding: 0 !important; }
+    .navbar { padding: 0 20px; }
+    .nav-inner { height: 62px; }
+    .hero-section { padding: 48px 20px 36px; }
+    .hero-stats { gap:24px; }
+    .feats-grid { padding: 0 20px; gap:12px; }
+    .sec-wrap { padding: 0 20px; }
+    div[data-testid="stButton"] > button { height: 48px !important; font-size:.75rem !important; }
+    .hero-actions { flex-direction: column; }
+    .trust-item { border-right: none; border-bottom: 1px solid rgba(255,255,255,.05); }
+}
+@media (max-width: 480px) {
+    .hero-stats { flex-wrap: wrap; gap: 20px; }
+    .feats-sec, .how-sec { padding: 72px 0; }
+}
+/* Decorative loops stop entirely for users who ask for less motion */
+@media (prefers-reduced-motion: reduce) {
+    .bg-canvas::before, .bg-grid::before,
+    .scan-beam, .scan-beam-2, .hex-float,
+    .nav-logo-spin, .brand-logo-spin,
+    .status-dot, .hero-badge::before, .hero-badge-dot, .hero-h1 .grad::after,
+    .term-wrap::before, .tc::after, .ping-dot, .t-cursor,
+    .st-key-nav_launch button::before,
+    .st-key-hero_launch button::before,
+    .st-key-cta_launch button::before,
+    .ticker-inner, .conn-arrow,
+    .glitch:hover::before, .glitch:hover::after,
+    .hero-badge, .hero-h1, .hero-h1-sub, .hero-desc, .hero-actions,
+    .hero-stats, .term-wrap, .t-line, .t-progress-fill {
+        animation: none !important;
+    }
+    .scan-beam, .scan-beam-2 { display: none; }
+}
+/* Touch-only devices (phones, tablets) are the usual low-GPU targets:
+   keep the page static behind the content, drop the full-viewport loops */
+@media (hover: none) and (pointer: coarse) {
+    .bg-canvas::before, .bg-grid::before, .hex-float { animation: none; }
+    .scan-beam, .scan-beam-2 { display: none; }
+}
+</style>
+"""
+
+PARTICLE_JS = """
+<script>
+(function() {
+    // Wait for canvas to be in DOM
+    function initParticles() {
+        const canvas = document.getElementById('particle-canvas');
+        if (!canvas) { setTimeout(initParticles, 200); return; }
+        const ctx = canvas.getContext('2d');
+        let W, H, particles = [], mouse = { x: -9999, y: -9999 };
+        const COLORS = ['rgba(0,212,255,', 'rgba(168,85,247,', 'rgba(52,211,153,', 'rgba(232,121,249,'];
+        
+        function resize() {
+            W = canvas.width  = window.innerWidth;
+            H = canvas.height = window.innerHeight;
+        }
+        
+        function Particle() {
+            this.reset = function() {
+                this.x  = Math.random() * W;
+                this.y  = Math.random() * H;
+                this.vx = (Math.random() - .5) * .4;
+                this.vy = (Math.random() - .5) * .4;
+                this.r  = Math.random() * 1.5 + .3;
+                this.a  = Math.random() * .5 + .05;
+                this.c  = COLORS[Math.floor(Math.random() * COLORS.length)];
+                this.life = 0;
+                this.maxLife = 200 + Math.random() * 400;
+            };
+            this.reset();
+            this.life = Math.random() * this.maxLife; // stagger start
+        }
+        
+        // Create particles
+        for (let i = 0; i < 90; i++) particles.push(new Particle());
+        
+        // Mouse parallax
+        document.addEventListener('mousemove', e => { mouse.x = e.clientX; mouse.y = e.clientY; });
+        
+        function draw() {
+            ctx.clearRect(0, 0, W, H);
+            
+            particles.forEach(p => {
+                p.life++;
+                if (p.life > p.maxLife) p.reset();
+                
+                // Mouse repulsion (subtle)
+                const dx = mouse.x - p.x, dy = mouse.y - p.y;
+                const dist = Math.sqrt(dx*dx + dy*dy);
+                if (dist < 120) {
+                    p.vx -= (dx / dist) * .015;
+                    p.vy -= (dy / dist) * .015;
+                }
+                // Damping
+                p.vx *= .998; p.vy *= .998;
+                p.x += p.vx; p.y += p.vy;
+                
+                // Fade in/out
+                const fadeLen = 60;
+                let alpha = p.a;
+                if (p.life < fadeLen) alpha = p.a * (p.life / fadeLen);
+                if (p.life > p.maxLife - fadeLen) alpha = p.a * ((p.maxLife - p.life) / fadeLen);
+                
+                // Draw
+                ctx.beginPath();
+                ctx.arc(p.x, p.y, p.r, 0, Math.PI * 2);
+                ctx.fillStyle = p.c + alpha + ')';
+                ctx.fill();
+                if (p.r > 1) {
+                    ctx.shadowBlur = 8;
+                    ctx.shadowColor = p.c + alpha + ')';
+                    ctx.fill();
+                    ctx.shadowBlur = 0;
+                }
+            });
+            
+            // Draw connection lines
+            for (let i = 0; i < particles.length; i++) {
+                for (let j = i + 1; j < particles.length; j++) {
+                    const a = particles[i], b = particles[j];
+                    const dx = a.x - b.x, dy = a.y - b.y;
+                    const dist = Math.sqrt(dx*dx + dy*dy);
+                    if (dist < 110) {
+                        const alpha = (1 - dist/110) * 0.04;
+                        ctx.beginPath();
+                        ctx.moveTo(a.x, a.y);
+                        ctx.lineTo(b.x, b.y);
+                        ctx.strokeStyle = `rgba(0,212,255,${alpha})`;
+                        ctx.lineWidth = .6;
+                        ctx.stroke();
+                    }
+                }
+            }
+            
+            requestAnimationFrame(draw);
+        }
+        
+        resize();
+        window.addEventListener('resize', resize);
+        draw();
+    }
+    
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initParticles);
+    } else {
+        initParticles();
+    }
+})();
+</script>
+"""
+
+
+# Stylesheet + fixed background layers, assembled once at import so each
+# rerun ships one prebuilt element instead of re-formatting two. Streamlit
+# drops any element a rerun does not re-emit, so this cannot be skipped on
+# later runs without losing the styles.
+_LANDING_HEAD = _minify_css(LANDING_CSS) + f"""
+<canvas id="particle-canvas"></canvas>
+<div class="bg-canvas"><div class="bg-grid"></div></div>
+<div class="scan-beam"></div>
+<div class="scan-beam-2"></div>
+<!-- Floating hex shapes -->
+<div class="hex-float">⬡</div>
+<div class="hex-float">◈</div>
+<div class="hex-float">⬡</div>
+<div class="hex-float">◇</div>
+<div class="hex-float">⬡</div>
+<div class="hex-float">◈</div>
+<div class="hex-float">◇</div>
+<div class="lp">
+{PARTICLE_JS}"""
+
+
+# CTA + footer styles. Kept out of LANDING_CSS and shipped alongside the CTA
+# markup, so the page-wide stylesheet only carries rules for above-the-fold
+# content.
+_CTA_FOOTER_CSS = """
+<style>
 /* ══════════════════════════════════════
    CTA SECTION
 ══════════════════════════════════════ */
 .cta-sec {
     padding: 110px 0;
     position: relative; overflow: hidden;
+    /* below the fold — skip layout/paint until scrolled near */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 560px;
 }
 .cta-sec::before {
     content: '';
@@ -955,6 +1230,7 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     text-align: center; position: relative; overflow: hidden;
     box-shadow: 0 0 100px rgba(168,85,247,.07), inset 0 1px 0 rgba(255,255,255,.05);
     z-index: 1;
+    contain: layout style paint;
 }
 .cta-box::before {
     content: '';
@@ -992,9 +1268,7 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     position: relative; z-index: 1;
 }
 .cta-title .g {
-    background: linear-gradient(135deg, var(--cyan), var(--violet), var(--mag-bright));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(135deg, var(--cyan), var(--violet), var(--mag-bright));
     filter: drop-shadow(0 0 16px rgba(0,212,255,.2));
 }
 .cta-desc {
@@ -1021,6 +1295,9 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     padding: 64px 0 30px;
     background: linear-gradient(180deg, #02020a 0%, #01010707 100%);
     position: relative;
+    /* below the fold — skip layout/paint until scrolled near */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 420px;
 }
 .footer-sec::before {
     content: '';
@@ -1028,9 +1305,12 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     background: linear-gradient(90deg, transparent, rgba(0,212,255,.15), rgba(168,85,247,.2), transparent);
 }
 .footer-grid {
-    display: grid; grid-template-columns: 2fr 1fr 1fr 1fr;
+    display: flex; flex-wrap: wrap;
     gap: 48px; margin-bottom: 48px;
 }
+/* Same 2:1:1:1 split as the old grid while everything fits on one row */
+.footer-grid > * { flex: 1 1 140px; }
+.footer-grid > :first-child { flex: 2 1 280px; }
 .footer-brand-name {
     font-family: var(--font-display); font-size: .85rem;
     font-weight: 800; letter-spacing: .15em;
@@ -1079,9 +1359,7 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     color: var(--text-3); letter-spacing: .06em;
 }
 .footer-copy-sig {
-    background: linear-gradient(90deg, var(--cyan-dim), var(--violet));
-    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-    background-clip: text;
+    background-image: linear-gradient(90deg, var(--cyan-dim), var(--violet));
 }
 .footer-copy-brand {
     display: flex;
@@ -1103,539 +1381,356 @@ div[data-testid="stButton"].btn-ghost > button:hover {
     font-size: .72rem;
 }
 
-/* ══════════════════════════════════════
-   ANIMATIONS
-══════════════════════════════════════ */
-@keyframes slideUp {
-    from { opacity:0; transform:translateY(32px); }
-    to   { opacity:1; transform:translateY(0); }
-}
-
-/* ══════════════════════════════════════
-   GLITCH TEXT EFFECT (on hover)
-══════════════════════════════════════ */
-.glitch {
-    position: relative;
-}
-.glitch:hover::before,
-.glitch:hover::after {
-    content: attr(data-text);
-    position: absolute; top: 0; left: 0;
-    width: 100%; height: 100%;
-    background: transparent;
-    -webkit-background-clip: text; background-clip: text;
-}
-.glitch:hover::before {
-    color: var(--cyan); opacity: .7;
-    animation: glitchTop .4s steps(2) infinite;
-    clip-path: polygon(0 0, 100% 0, 100% 40%, 0 40%);
-}
-.glitch:hover::after {
-    color: var(--mag-bright); opacity: .7;
-    animation: glitchBot .4s steps(2) infinite;
-    clip-path: polygon(0 60%, 100% 60%, 100% 100%, 0 100%);
-}
-@keyframes glitchTop {
-    0%   { transform: translate(-2px, -1px); }
-    50%  { transform: translate(2px, 1px); }
-    100% { transform: translate(-1px, 2px); }
-}
-@keyframes glitchBot {
-    0%   { transform: translate(2px, 1px); }
-    50%  { transform: translate(-2px, -1px); }
-    100% { transform: translate(1px, -2px); }
-}
-
-/* ══════════════════════════════════════
-   RESPONSIVE
-══════════════════════════════════════ */
 @media (max-width: 1100px) {
-    .hero-section  { grid-template-columns: 1fr; gap:48px; padding:64px 32px 48px; }
-    .feats-grid    { grid-template-columns: repeat(2,1fr); }
-    .steps-row     { grid-template-columns: 1fr; gap:16px; }
-    .step-connector{ display:none; }
-    .trust-grid    { grid-template-columns: repeat(2,1fr); }
-    .footer-grid   { grid-template-columns: 1fr 1fr; gap:36px; }
-    .nav-center-links { display:none; }
+    .footer-grid   { gap:36px; }
 }
 @media (max-width: 768px) {
-    .block-container { padding: 0 !important; }
-    .navbar { padding: 0 20px; }
-    .nav-inner { height: 62px; }
-    .hero-section { padding: 48px 20px 36px; }
-    .hero-stats { gap:24px; }
-    .feats-grid { grid-template-columns: 1fr; padding: 0 20px; gap:12px; }
-    .sec-wrap, .footer-inner { padding: 0 20px; }
+    .footer-inner { padding: 0 20px; }
     .cta-box { padding: 52px 24px; border-radius: 18px; }
-    .footer-grid { grid-template-columns: 1fr; gap:28px; }
+    .cta-actions { flex-direction: column; }
+    .footer-grid { gap:28px; }
+    .footer-grid > *, .footer-grid > :first-child { flex-basis: 100%; }
     .footer-bottom { flex-direction: column; gap:10px; text-align:center; }
-    div[data-testid="stButton"] > button { height: 48px !important; font-size:.75rem !important; }
-    .hero-actions, .cta-actions { flex-direction: column; }
-    div[data-testid="stButton"].btn-primary > button,
-    div[data-testid="stButton"].btn-ghost > button { width: 100% !important; }
-    .trust-item { border-right: none; border-bottom: 1px solid rgba(255,255,255,.05); }
 }
 @media (max-width: 480px) {
-    .trust-grid { grid-template-columns: 1fr 1fr; }
-    .hero-stats { flex-wrap: wrap; gap: 20px; }
-    .feats-sec, .how-sec, .cta-sec { padding: 72px 0; }
+    .cta-sec { padding: 72px 0; }
+}
+@media (prefers-reduced-motion: reduce) {
+    .cta-sec::after, .cta-box::after { animation: none !important; }
 }
 </style>
 """
 
-PARTICLE_JS = """
-<script>
-(function() {
-    // Wait for canvas to be in DOM
-    function initParticles() {
-        const canvas = document.getElementById('particle-canvas');
-        if (!canvas) { setTimeout(initParticles, 200); return; }
-        const ctx = canvas.getContext('2d');
-        let W, H, particles = [], mouse = { x: -9999, y: -9999 };
-        const COLORS = ['rgba(0,212,255,', 'rgba(168,85,247,', 'rgba(52,211,153,', 'rgba(232,121,249,'];
-        
-        function resize() {
-            W = canvas.width  = window.innerWidth;
-            H = canvas.height = window.innerHeight;
-        }
-        
-        function Particle() {
-            this.reset = function() {
-                this.x  = Math.random() * W;
-                this.y  = Math.random() * H;
-                this.vx = (Math.random() - .5) * .4;
-                this.vy = (Math.random() - .5) * .4;
-                this.r  = Math.random() * 1.5 + .3;
-                this.a  = Math.random() * .5 + .05;
-                this.c  = COLORS[Math.floor(Math.random() * COLORS.length)];
-                this.life = 0;
-                this.maxLife = 200 + Math.random() * 400;
-            };
-            this.reset();
-            this.life = Math.random() * this.maxLife; // stagger start
-        }
-        
-        // Create particles
-        for (let i = 0; i < 90; i++) particles.push(new Particle());
-        
-        // Mouse parallax
-        document.addEventListener('mousemove', e => { mouse.x = e.clientX; mouse.y = e.clientY; });
-        
-        function draw() {
-            ctx.clearRect(0, 0, W, H);
-            
-            particles.forEach(p => {
-                p.life++;
-                if (p.life > p.maxLife) p.reset();
-                
-                // Mouse repulsion (subtle)
-                const dx = mouse.x - p.x, dy = mouse.y - p.y;
-                const dist = Math.sqrt(dx*dx + dy*dy);
-                if (dist < 120) {
-                    p.vx -= (dx / dist) * .015;
-                    p.vy -= (dy / dist) * .015;
-                }
-                // Damping
-                p.vx *= .998; p.vy *= .998;
-                p.x += p.vx; p.y += p.vy;
-                
-                // Fade in/out
-                const fadeLen = 60;
-                let alpha = p.a;
-                if (p.life < fadeLen) alpha = p.a * (p.life / fadeLen);
-                if (p.life > p.maxLife - fadeLen) alpha = p.a * ((p.maxLife - p.life) / fadeLen);
-                
-                // Draw
-                ctx.beginPath();
-                ctx.arc(p.x, p.y, p.r, 0, Math.PI * 2);
-                ctx.fillStyle = p.c + alpha + ')';
-                ctx.fill();
-                if (p.r > 1) {
-                    ctx.shadowBlur = 8;
-                    ctx.shadowColor = p.c + alpha + ')';
-                    ctx.fill();
-                    ctx.shadowBlur = 0;
-                }
-            });
-            
-            // Draw connection lines
-            for (let i = 0; i < particles.length; i++) {
-                for (let j = i + 1; j < particles.length; j++) {
-                    const a = particles[i], b = particles[j];
-                    const dx = a.x - b.x, dy = a.y - b.y;
-                    const dist = Math.sqrt(dx*dx + dy*dy);
-                    if (dist < 110) {
-                        const alpha = (1 - dist/110) * 0.04;
-                        ctx.beginPath();
-                        ctx.moveTo(a.x, a.y);
-                        ctx.lineTo(b.x, b.y);
-                        ctx.strokeStyle = `rgba(0,212,255,${alpha})`;
-                        ctx.lineWidth = .6;
-                        ctx.stroke();
-                    }
-                }
-            }
-            
-            requestAnimationFrame(draw);
-        }
-        
-        resize();
-        window.addEventListener('resize', resize);
-        draw();
-    }
-    
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', initParticles);
-    } else {
-        initParticles();
-    }
-})();
-</script>
-"""
-
-
-def show_landing_page():
-    """
-    Renders the ultra-premium landing page.
-    Returns True when any CTA button is clicked.
-    """
-    st.markdown(LANDING_CSS, unsafe_allow_html=True)
-
-    # Particle canvas + background layers
-    st.markdown(f"""
-    <canvas id="particle-canvas"></canvas>
-    <div class="bg-canvas"></div>
-    <div class="scan-beam"></div>
-    <div class="scan-beam-2"></div>
-    <!-- Floating hex shapes -->
-    <div class="hex-float">⬡</div>
-    <div class="hex-float">◈</div>
-    <div class="hex-float">⬡</div>
-    <div class="hex-float">◇</div>
-    <div class="hex-float">⬡</div>
-    <div class="hex-float">◈</div>
-    <div class="hex-float">◇</div>
-    <div class="lp">
-    {PARTICLE_JS}
-    """, unsafe_allow_html=True)
-
-    # ─── NAVBAR ────────────────────────────────────────────────────────────────
-    st.markdown("""
-    <div class="navbar">
-        <div class="nav-inner">
-            <div class="nav-brand">
-                <div class="nav-logo-ring">
-                    <div class="nav-logo-bg"></div>
-                    <div class="nav-logo-spin"></div>
-                    <span class="nav-logo-icon">🛡</span>
-                </div>
-                <div class="nav-brand-stack">
-                    <span class="nav-wordmark"><em>VULN</em>SAGE</span>
-                    <span class="nav-brand-sub">AI-Powered Web Vulnerability Scanner</span>
-                </div>
+# Static page sections. Built once at import; show_landing_page() only
+# interleaves them with the Streamlit buttons.
+_NAVBAR_HTML = _minify_html("""
+<div class="navbar">
+    <div class="nav-inner">
+        <div class="nav-brand">
+            <div class="nav-logo-ring">
+                <div class="nav-logo-bg"></div>
+                <div class="nav-logo-spin"></div>
+                <span class="nav-logo-icon">🛡</span>
             </div>
-            <div class="nav-center-links">
-                <a href="#" class="nav-link">Features</a>
-                <a href="#" class="nav-link">How It Works</a>
-                <a href="#" class="nav-link">Docs</a>
-                <a href="#" class="nav-link">Pricing</a>
-            </div>
-            <div class="nav-status-chip">
-                <div class="status-dot"></div>
-                ALL SYSTEMS ONLINE
+            <div class="nav-brand-stack">
+                <span class="nav-wordmark"><em>VULN</em>SAGE</span>
+                <span class="nav-brand-sub">AI-Powered Web Vulnerability Scanner</span>
             </div>
         </div>
+        <div class="nav-center-links">
+            <a href="#" class="nav-link">Features</a>
+            <a href="#" class="nav-link">How It Works</a>
+            <a href="#" class="nav-link">Docs</a>
+            <a href="#" class="nav-link">Pricing</a>
+        </div>
+        <div class="nav-status-chip">
+            <div class="status-dot"></div>
+            ALL SYSTEMS ONLINE
+        </div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+""")
 
-    _, nav_btn_col = st.columns([5, 1])
-    with nav_btn_col:
-        st.markdown('<div class="btn-primary" style="margin-top:-54px;margin-right:10px">',
-                    unsafe_allow_html=True)
-        nav_launch = st.button("Login/Signup", key="nav_launch", use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
 
-    # ─── HERO ──────────────────────────────────────────────────────────────────
-    st.markdown('<div class="hero-outer">', unsafe_allow_html=True)
-    h_left, h_right = st.columns([1.15, 0.85], gap="large")
+_HERO_LEFT_HTML = _minify_html("""
+<div class="hero-section" style="display:block;padding:88px 48px 0;">
+    <div class="hero-badge">
+        <div class="hero-badge-dot"></div>
+        ⬡ &nbsp;Agentic AI Security Platform · v4.0 · OWASP-Ready
+    </div>
+    <h1 class="hero-h1">
+        Detect Threats<br>
+        <span class="grad" data-text="Before Attackers">Before Attackers</span><br>
+        Strike.
+    </h1>
+    <p class="hero-h1-sub">Precision vulnerability scanning, operationally ready.</p>
+    <p class="hero-desc">
+        The platform combines deep crawling, ML-powered detection, and AI orchestration
+        to surface XSS, SQLi, header misconfigurations, and critical risks — with
+        evidence-first output, CVSS scoring, and auto-generated fix code.
+    </p>
+</div>
+""")
 
-    with h_left:
-        st.markdown("""
-        <div class="hero-section" style="display:block;padding:88px 48px 0;">
-            <div class="hero-badge">
-                <div class="hero-badge-dot"></div>
-                ⬡ &nbsp;Agentic AI Security Platform · v4.0 · OWASP-Ready
+
+_TERMINAL_HTML = _minify_html("""
+<div class="term-wrap" style="padding:88px 48px 0 0;">
+    <div class="term-frame">
+        <div class="term-topbar">
+            <div class="term-circs">
+                <span class="tc tc-r"></span>
+                <span class="tc tc-y"></span>
+                <span class="tc tc-g"></span>
             </div>
-            <h1 class="hero-h1">
-                Detect Threats<br>
-                <span class="grad" data-text="Before Attackers">Before Attackers</span><br>
-                Strike.
-            </h1>
-            <p class="hero-h1-sub">Precision vulnerability scanning, operationally ready.</p>
-            <p class="hero-desc">
-                The platform combines deep crawling, ML-powered detection, and AI orchestration
-                to surface XSS, SQLi, header misconfigurations, and critical risks — with
-                evidence-first output, CVSS scoring, and auto-generated fix code.
-            </p>
+            <span class="term-title">secure-scan.log · target: example.com</span>
+            <span class="ping-dot"></span>
         </div>
-        """, unsafe_allow_html=True)
-
-        bc1, bc2 = st.columns([1.1, 0.9])
-        with bc1:
-            st.markdown('<div class="btn-primary" style="padding-left:48px">', unsafe_allow_html=True)
-            hero_launch = st.button("🚀 Launch Scanner", key="hero_launch", use_container_width=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-        with bc2:
-            st.markdown('<div class="btn-ghost">', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-
-    with h_right:
-        st.markdown("""
-        <div class="term-wrap" style="padding:88px 48px 0 0;">
-            <div class="term-frame">
-                <div class="term-topbar">
-                    <div class="term-circs">
-                        <span class="tc tc-r"></span>
-                        <span class="tc tc-y"></span>
-                        <span class="tc tc-g"></span>
-                    </div>
-                    <span class="term-title">secure-scan.log · target: example.com</span>
-                    <span class="ping-dot"></span>
-                </div>
-                <div class="term-body">
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-mute">Initializing security scanner neural engine...</span></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-ok">✓  Neural model loaded — 2.4 GB weights</span></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-ok">✓  Threat DB synced — 847,312 signatures</span></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-info">⬡  Subdomain enumeration: 14 targets found</span></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-mute">Crawling &amp; fingerprinting target surface...</span></div>
-                    <div class="t-line">
-                        <span class="t-prompt">›</span>
-                        <span class="t-mute">Deep scan progress: <span class="t-ok">87%</span></span>
-                    </div>
-                    <div class="t-progress-bar"><div class="t-progress-fill"></div></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-warn">⚠&nbsp; XSS found <span class="t-badge t-badge-med">MEDIUM</span><span class="t-mute"> · conf: 94% · /search?q=</span></span></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-err">✗&nbsp; SQLi risk <span class="t-badge t-badge-crit">CRITICAL</span><span class="t-mute"> · conf: 99% · /api/users</span></span></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-ok">✓&nbsp; Misconfig <span class="t-badge t-badge-low">LOW</span><span class="t-mute"> · HSTS header missing</span></span></div>
-                    <div class="t-line"><span class="t-prompt">›</span><span class="t-info">⬡  Generating remediation report… <span class="t-cursor"></span></span></div>
-                </div>
+        <div class="term-body">
+            <div class="t-line" style="--i:0"><span class="t-mute">Initializing security scanner neural engine...</span></div>
+            <div class="t-line" style="--i:1"><span class="t-ok">✓  Neural model loaded — 2.4 GB weights</span></div>
+            <div class="t-line" style="--i:2"><span class="t-ok">✓  Threat DB synced — 847,312 signatures</span></div>
+            <div class="t-line" style="--i:3"><span class="t-info">⬡  Subdomain enumeration: 14 targets found</span></div>
+            <div class="t-line" style="--i:4"><span class="t-mute">Crawling &amp; fingerprinting target surface...</span></div>
+            <div class="t-line" style="--i:5">
+                <span class="t-mute">Deep scan progress: <span class="t-ok">87%</span></span>
             </div>
+            <div class="t-progress-bar"><div class="t-progress-fill"></div></div>
+            <div class="t-line" style="--i:6"><span class="t-warn">⚠&nbsp; XSS found <span class="t-badge t-badge-med">MEDIUM</span><span class="t-mute"> · conf: 94% · /search?q=</span></span></div>
+            <div class="t-line" style="--i:7"><span class="t-err">✗&nbsp; SQLi risk <span class="t-badge t-badge-crit">CRITICAL</span><span class="t-mute"> · conf: 99% · /api/users</span></span></div>
+            <div class="t-line" style="--i:8"><span class="t-ok">✓&nbsp; Misconfig <span class="t-badge t-badge-low">LOW</span><span class="t-mute"> · HSTS header missing</span></span></div>
+            <div class="t-line" style="--i:9"><span class="t-info">⬡  Generating remediation report… <span class="t-cursor"></span></span></div>
         </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown('</div>', unsafe_allow_html=True)  # /hero-outer
-
-    # ─── LIVE THREAT TICKER ────────────────────────────────────────────────────
-    ticker_items = (
-        '<span class="t-err">✗</span> SQLi Blocked · api.target.io/v2/users',
-        '<span class="t-warn">⚠</span> XSS Detected · shop.example.com/search',
-        '<span class="t-ok">✓</span> Scan Complete · secure.fintech.co · 0 critical',
-        '<span class="t-err">✗</span> SSRF Attempt · internal.api/metadata',
-        '<span class="t-warn">⚠</span> Open Redirect · auth.portal.net',
-        '<span class="t-ok">✓</span> Headers Fixed · payments.app · HSTS enforced',
-        '<span class="t-err">✗</span> IDOR Risk · /api/invoice/4821',
-        '<span class="t-warn">⚠</span> RCE Pattern · upload.legacy.com/file',
-        '<span class="t-ok">✓</span> Report Exported · enterprise-audit-2026.pdf',
-    )
-    ticker_html = ''.join(
-        f'<span class="ticker-item">{item}</span>'
-        for item in ticker_items
-    ) * 2  # duplicate for seamless loop
-
-    st.markdown(f"""
-    <div class="ticker-sec">
-        <div class="ticker-inner">
-            {ticker_html}
+    </div>
+</div>
+""")
+
+
+_TICKER_ITEMS = (
+    '<span class="t-err">✗</span> SQLi Blocked · api.target.io/v2/users',
+    '<span class="t-warn">⚠</span> XSS Detected · shop.example.com/search',
+    '<span class="t-ok">✓</span> Scan Complete · secure.fintech.co · 0 critical',
+    '<span class="t-err">✗</span> SSRF Attempt · internal.api/metadata',
+    '<span class="t-warn">⚠</span> Open Redirect · auth.portal.net',
+    '<span class="t-ok">✓</span> Headers Fixed · payments.app · HSTS enforced',
+    '<span class="t-err">✗</span> IDOR Risk · /api/invoice/4821',
+    '<span class="t-warn">⚠</span> RCE Pattern · upload.legacy.com/file',
+    '<span class="t-ok">✓</span> Report Exported · enterprise-audit-2026.pdf',
+)
+_TICKER_ROW = "".join(
+    f'<span class="ticker-item">{item}</span>' for item in _TICKER_ITEMS
+) * 2  # duplicate for seamless loop
+_TICKER_HTML = _minify_html(f"""
+<div class="ticker-sec">
+    <div class="ticker-inner">
+        {_TICKER_ROW}
+    </div>
+</div>
+""")
+
+
+# Feature cards: (index label, icon, title, description, tag class, tag text).
+_FEATURES = (
+    ("XSS Detection", "🎯", "Cross-Site Scripting",
+     "Identify reflected, stored, and DOM-based XSS with deep pattern recognition and contextual AI validation to eliminate false positives.",
+     "tag-cyan", "AI-Powered"),
+    ("Injection Attacks", "💉", "SQL & NoSQL Injection",
+     "Advanced detection of SQL, NoSQL, and command injection vectors before they compromise your data layer — with exact proof-of-concept output.",
+     "tag-red", "Critical Risk"),
+    ("Header Audit", "🛡️", "Security Header Analysis",
+     "Comprehensive audit of CSP, X-Frame-Options, HSTS, CORS, Permissions-Policy — with severity scoring and ready-to-deploy fix snippets.",
+     "tag-violet", "Deep Audit"),
+    ("Real-time", "⚡", "Live Scanning Engine",
+     "Instant multi-subdomain assessment with real-time status updates, granular progress logs, and parallel execution across all targets.",
+     "tag-amber", "&lt; 60 Seconds"),
+    ("AI Orchestration", "🤖", "Agentic AI Engine",
+     "LLM-powered threat assessment for intelligent risk prioritization, automated remediation planning, and adaptive attack-surface reasoning.",
+     "tag-green", "LLM Powered"),
+    ("Reporting", "📋", "Executive & Technical Reports",
+     "Auto-generated security reports with CVSS scores, risk prioritization, evidence chains, code-level fixes, and exportable formats for all stakeholders.",
+     "tag-mag", "Auto-Generated"),
+)
+_FEATURE_CARDS = "".join(
+    f'<div class="feat-card"><div class="card-left-border"></div>'
+    f'<span class="feat-idx">{n:02d} — {label}</span>'
+    f'<div class="feat-icon-wrap">{icon}</div>'
+    f'<div class="feat-title">{title}</div>'
+    f'<p class="feat-desc">{desc}</p>'
+    f'<span class="feat-tag {tag_cls}">{tag}</span></div>'
+    for n, (label, icon, title, desc, tag_cls, tag) in enumerate(_FEATURES, 1)
+)
+_FEATURES_HTML = _minify_html(f"""
+<div class="feats-sec">
+    <div class="sec-wrap">
+        <div class="sec-head">
+            <span class="sec-eyebrow">Capabilities</span>
+            <h2 class="sec-title">A Full <span class="g">Arsenal</span> of Detection</h2>
+            <p class="sec-sub">Military-grade vulnerability analysis powered by AI, ML, and deep threat intelligence</p>
         </div>
+        <div class="feats-grid">{_FEATURE_CARDS}</div>
     </div>
-    """, unsafe_allow_html=True)
-
-    # ─── FEATURE CARDS ─────────────────────────────────────────────────────────
-    st.markdown("""
-    <div class="feats-sec">
-        <div class="sec-wrap">
-            <div class="sec-head">
-                <span class="sec-eyebrow">Capabilities</span>
-                <h2 class="sec-title">A Full <span class="g">Arsenal</span> of Detection</h2>
-                <p class="sec-sub">Military-grade vulnerability analysis powered by AI, ML, and deep threat intelligence</p>
+</div>
+""")
+
+
+_HOW_HTML = _minify_html("""
+<div class="how-sec">
+    <div class="sec-wrap">
+        <div class="sec-head">
+            <span class="sec-eyebrow">Process</span>
+            <h2 class="sec-title">How <span class="g">It Works</span></h2>
+            <p class="sec-sub">Three precise steps from target to comprehensive security intelligence</p>
+        </div>
+        <div class="steps-row">
+            <div class="step-card">
+                <span class="step-number">01</span>
+                <span class="step-icon">🔗</span>
+                <div class="step-title">Submit Target URL</div>
+                <p class="step-desc">Enter any domain or URL — the AI engine automatically maps the full attack surface, enumerates subdomains, and profiles the tech stack.</p>
             </div>
-            <div class="feats-grid">
-                <div class="feat-card">
-                    <div class="card-left-border"></div>
-                    <span class="feat-idx">01 — XSS Detection</span>
-                    <div class="feat-icon-wrap">🎯</div>
-                    <div class="feat-title">Cross-Site Scripting</div>
-                    <p class="feat-desc">Identify reflected, stored, and DOM-based XSS with deep pattern recognition and contextual AI validation to eliminate false positives.</p>
-                    <span class="feat-tag tag-cyan">AI-Powered</span>
-                </div>
-                <div class="feat-card">
-                    <div class="card-left-border"></div>
-                    <span class="feat-idx">02 — Injection Attacks</span>
-                    <div class="feat-icon-wrap">💉</div>
-                    <div class="feat-title">SQL & NoSQL Injection</div>
-                    <p class="feat-desc">Advanced detection of SQL, NoSQL, and command injection vectors before they compromise your data layer — with exact proof-of-concept output.</p>
-                    <span class="feat-tag tag-red">Critical Risk</span>
-                </div>
-                <div class="feat-card">
-                    <div class="card-left-border"></div>
-                    <span class="feat-idx">03 — Header Audit</span>
-                    <div class="feat-icon-wrap">🛡️</div>
-                    <div class="feat-title">Security Header Analysis</div>
-                    <p class="feat-desc">Comprehensive audit of CSP, X-Frame-Options, HSTS, CORS, Permissions-Policy — with severity scoring and ready-to-deploy fix snippets.</p>
-                    <span class="feat-tag tag-violet">Deep Audit</span>
-                </div>
-                <div class="feat-card">
-                    <div class="card-left-border"></div>
-                    <span class="feat-idx">04 — Real-time</span>
-                    <div class="feat-icon-wrap">⚡</div>
-                    <div class="feat-title">Live Scanning Engine</div>
-                    <p class="feat-desc">Instant multi-subdomain assessment with real-time status updates, granular progress logs, and parallel execution across all targets.</p>
-                    <span class="feat-tag tag-amber">&lt; 60 Seconds</span>
-                </div>
-                <div class="feat-card">
-                    <div class="card-left-border"></div>
-                    <span class="feat-idx">05 — AI Orchestration</span>
-                    <div class="feat-icon-wrap">🤖</div>
-                    <div class="feat-title">Agentic AI Engine</div>
-                    <p class="feat-desc">LLM-powered threat assessment for intelligent risk prioritization, automated remediation planning, and adaptive attack-surface reasoning.</p>
-                    <span class="feat-tag tag-green">LLM Powered</span>
-                </div>
-                <div class="feat-card">
-                    <div class="card-left-border"></div>
-                    <span class="feat-idx">06 — Reporting</span>
-                    <div class="feat-icon-wrap">📋</div>
-                    <div class="feat-title">Executive & Technical Reports</div>
-                    <p class="feat-desc">Auto-generated security reports with CVSS scores, risk prioritization, evidence chains, code-level fixes, and exportable formats for all stakeholders.</p>
-                    <span class="feat-tag tag-mag">Auto-Generated</span>
-                </div>
+            <div class="step-connector">
+                <div class="conn-arrow"></div>
             </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # ─── HOW IT WORKS ──────────────────────────────────────────────────────────
-    st.markdown("""
-    <div class="how-sec">
-        <div class="sec-wrap">
-            <div class="sec-head">
-                <span class="sec-eyebrow">Process</span>
-                <h2 class="sec-title">How <span class="g">It Works</span></h2>
-                <p class="sec-sub">Three precise steps from target to comprehensive security intelligence</p>
+            <div class="step-card">
+                <span class="step-number">02</span>
+                <span class="step-icon">🧠</span>
+                <div class="step-title">AI Deep Analysis</div>
+                <p class="step-desc">Multi-layer checks — ML threat modeling, rule-based OWASP scanning, and agentic AI inspection — all run in parallel for maximum coverage.</p>
             </div>
-            <div class="steps-row">
-                <div class="step-card">
-                    <span class="step-number">01</span>
-                    <span class="step-icon">🔗</span>
-                    <div class="step-title">Submit Target URL</div>
-                    <p class="step-desc">Enter any domain or URL — the AI engine automatically maps the full attack surface, enumerates subdomains, and profiles the tech stack.</p>
-                </div>
-                <div class="step-connector">
-                    <div class="conn-arrow"></div>
-                </div>
-                <div class="step-card">
-                    <span class="step-number">02</span>
-                    <span class="step-icon">🧠</span>
-                    <div class="step-title">AI Deep Analysis</div>
-                    <p class="step-desc">Multi-layer checks — ML threat modeling, rule-based OWASP scanning, and agentic AI inspection — all run in parallel for maximum coverage.</p>
-                </div>
-                <div class="step-connector">
-                    <div class="conn-arrow"></div>
-                </div>
-                <div class="step-card">
-                    <span class="step-number">03</span>
-                    <span class="step-icon">📊</span>
-                    <div class="step-title">Get Actionable Report</div>
-                    <p class="step-desc">A detailed vulnerability report with CVSS scores, risk prioritization, proof-of-concept evidence, and step-by-step remediation code.</p>
-                </div>
+            <div class="step-connector">
+                <div class="conn-arrow"></div>
             </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # ─── CTA ───────────────────────────────────────────────────────────────────
-    st.markdown("""
-    <div class="cta-sec">
-        <div class="sec-wrap">
-            <div class="cta-box">
-                <span class="cta-badge">✦ No Credit Card · No Setup · Free to Start</span>
-                <h2 class="cta-title">
-                    Ready to Secure<br><span class="g">Your Applications?</span>
-                </h2>
-                <p class="cta-desc">
-                    Start scanning in seconds and shield your systems from critical vulnerabilities.<br>
-                    Production-ready results in under a minute with full remediation guidance.
-                </p>
+            <div class="step-card">
+                <span class="step-number">03</span>
+                <span class="step-icon">📊</span>
+                <div class="step-title">Get Actionable Report</div>
+                <p class="step-desc">A detailed vulnerability report with CVSS scores, risk prioritization, proof-of-concept evidence, and step-by-step remediation code.</p>
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+""")
 
-    _, cta_col, _ = st.columns([1, 2, 1])
-    with cta_col:
-        st.markdown('<div class="btn-primary" style="margin-top:-48px">', unsafe_allow_html=True)
-        cta_launch = st.button("🚀 Start Free Scan", key="cta_launch", use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
 
-    st.markdown("""
-    <div style="text-align:center; margin-top: -16px; padding-bottom: 80px;">
-        <span class="cta-micro">✓ Free tier ·  ✓ Auto-generated fix code</span>
+# CTA box and micro-copy emitted above/below the "Start Free Scan" button.
+_CTA_HTML = _minify_css(_CTA_FOOTER_CSS) + _minify_html("""
+<div class="cta-sec">
+    <div class="sec-wrap">
+        <div class="cta-box">
+            <span class="cta-badge">✦ No Credit Card · No Setup · Free to Start</span>
+            <h2 class="cta-title">
+                Ready to Secure<br><span class="g">Your Applications?</span>
+            </h2>
+            <p class="cta-desc">
+                Start scanning in seconds and shield your systems from critical vulnerabilities.<br>
+                Production-ready results in under a minute with full remediation guidance.
+            </p>
+        </div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+""")
 
-    # ─── FOOTER ────────────────────────────────────────────────────────────────
-    st.markdown("""
-    <div class="footer-sec">
-        <div class="sec-wrap footer-inner">
-            <div class="footer-grid">
-                <div>
-                    <div class="footer-brand-name">
-                        <div class="brand-logo-ring">
-                            <div class="brand-logo-bg"></div>
-                            <div class="brand-logo-spin"></div>
-                            <span class="brand-logo-icon">🛡</span>
-                        </div>
-                        <div>
-                            <span class="brand-wordmark"><em>VULN</em>SAGE</span>
-                            <div class="brand-subline">AI-Powered Web Vulnerability Scanner</div>
-                        </div>
+_CTA_MICRO_HTML = _minify_html("""
+<div style="text-align:center; margin-top: -16px; padding-bottom: 80px;">
+    <span class="cta-micro">✓ Free tier ·  ✓ Auto-generated fix code</span>
+</div>
+""")
+
+
+# Footer link columns: (heading, link labels).
+_FOOTER_LINKS = (
+    ("Product",   ("Features", "How It Works", "Dashboard", "Changelog")),
+    ("Resources", ("Documentation", "API Reference", "OWASP Guide", "Security Blog")),
+    ("Company",   ("About", "Privacy Policy", "Terms of Use", "Contact")),
+)
+_FOOTER_LINK_COLS = "".join(
+    f'<div><div class="footer-col-head">{head}</div>'
+    + "".join(f'<a href="#" class="footer-lnk">{label}</a>' for label in links)
+    + "</div>"
+    for head, links in _FOOTER_LINKS
+)
+
+_YEAR = date.today().year
+
+# Footer sits far below the CTA; built once at import and kept out of the
+# per-rerun render path. `.footer-sec` uses content-visibility so the browser
+# skips its layout/paint until it is scrolled near the viewport.
+_FOOTER_HTML = _minify_html(f"""
+<div class="footer-sec">
+    <div class="sec-wrap footer-inner">
+        <div class="footer-grid">
+            <div>
+                <div class="footer-brand-name">
+                    <div class="brand-logo-ring">
+                        <div class="brand-logo-bg"></div>
+                        <div class="brand-logo-spin"></div>
+                        <span class="brand-logo-icon">🛡</span>
+                    </div>
+                    <div>
+                        <span class="brand-wordmark"><em>VULN</em>SAGE</span>
+                        <div class="brand-subline">AI-Powered Web Vulnerability Scanner</div>
                     </div>
-                    <p class="footer-tagline">Agentic AI web security scanning with ML-powered detection, threat intelligence enrichment, and remediation guidance. Built for defenders.</p>
-                </div>
-                <div>
-                    <div class="footer-col-head">Product</div>
-                    <a href="#" class="footer-lnk">Features</a>
-                    <a href="#" class="footer-lnk">How It Works</a>
-                    <a href="#" class="footer-lnk">Dashboard</a>
-                    <a href="#" class="footer-lnk">Changelog</a>
-                </div>
-                <div>
-                    <div class="footer-col-head">Resources</div>
-                    <a href="#" class="footer-lnk">Documentation</a>
-                    <a href="#" class="footer-lnk">API Reference</a>
-                    <a href="#" class="footer-lnk">OWASP Guide</a>
-                    <a href="#" class="footer-lnk">Security Blog</a>
-                </div>
-                <div>
-                    <div class="footer-col-head">Company</div>
-                    <a href="#" class="footer-lnk">About</a>
-                    <a href="#" class="footer-lnk">Privacy Policy</a>
-                    <a href="#" class="footer-lnk">Terms of Use</a>
-                    <a href="#" class="footer-lnk">Contact</a>
                 </div>
+                <p class="footer-tagline">Agentic AI web security scanning with ML-powered detection, threat intelligence enrichment, and remediation guidance. Built for defenders.</p>
             </div>
-            <div class="footer-bottom">
-                <span class="footer-copy-brand">
-                    <span class="nav-logo-ring brand-mini">
-                        <span class="nav-logo-bg"></span>
-                        <span class="nav-logo-spin"></span>
-                        <span class="nav-logo-icon">🛡</span>
-                    </span>
-                    <span>© 2026 VULNSAGE. All rights reserved.</span>
+{_FOOTER_LINK_COLS}
+        </div>
+        <div class="footer-bottom">
+            <span class="footer-copy-brand">
+                <span class="nav-logo-ring brand-mini">
+                    <span class="nav-logo-bg"></span>
+                    <span class="nav-logo-spin"></span>
+                    <span class="nav-logo-icon">🛡</span>
                 </span>
-                <span class="footer-copy-sig">Built for defenders. Powered by AI.</span>
-            </div>
+                <span>© {_YEAR} VULNSAGE. All rights reserved.</span>
+            </span>
+            <span class="footer-copy-sig">Built for defenders. Powered by AI.</span>
         </div>
     </div>
-    </div><!-- /lp -->
-    """, unsafe_allow_html=True)
+</div>
+</div><!-- /lp -->
+""")
+
+# Every run between two buttons is fused into one st.markdown element:
+# fewer element deltas per rerun and fewer markdown containers in the DOM.
+_PAGE_TOP_HTML = _LANDING_HEAD + _NAVBAR_HTML
+_SECTIONS_HTML = _TICKER_HTML + _FEATURES_HTML + _HOW_HTML + _CTA_HTML
+_PAGE_BOTTOM_HTML = _CTA_MICRO_HTML + _FOOTER_HTML
+
+
+def _record_launch(key: str) -> None:
+    st.session_state["_landing_launch"] = key
+
+
+def _launch_button(label: str, key: str) -> None:
+    """
+    Launch button whose click is recorded by an on_click callback, which
+    Streamlit runs before the rerun, so show_landing_page() can return the
+    event on that rerun without rendering the page again.
+    """
+    st.button(label, key=key, on_click=_record_launch, args=(key,), use_container_width=True)
+
+
+def show_landing_page() -> LandingEvent:
+    """
+    Renders the ultra-premium landing page.
+    Returns a LandingEvent with one flag per CTA button.
+    """
+    # A launch button was clicked: report it without rendering the page
+    # again, since the caller is about to navigate away.
+    launched = st.session_state.pop("_landing_launch", None)
+    if launched:
+        return LandingEvent(
+            launched == "nav_launch", launched == "hero_launch", launched == "cta_launch"
+        )
+
+    # ─── BACKGROUND + NAVBAR ───────────────────────────────────────────────────
+    st.markdown(_PAGE_TOP_HTML, unsafe_allow_html=True)
+
+    _, nav_btn_col = st.columns([5, 1])
+    with nav_btn_col:
+        _launch_button("Login/Signup", "nav_launch")
+
+    # ─── HERO ──────────────────────────────────────────────────────────────────
+    h_left, h_right = st.columns([1.15, 0.85], gap="large")
+
+    with h_left:
+        st.markdown(_HERO_LEFT_HTML, unsafe_allow_html=True)
+
+        bc1, _ = st.columns([1.1, 0.9])
+        with bc1:
+            _launch_button("🚀 Launch Scanner", "hero_launch")
+
+    with h_right:
+        st.markdown(_TERMINAL_HTML, unsafe_allow_html=True)
+
+    # ─── TICKER · FEATURES · HOW IT WORKS · CTA ────────────────────────────────
+    st.markdown(_SECTIONS_HTML, unsafe_allow_html=True)
+
+    _, cta_col, _ = st.columns([1, 2, 1])
+    with cta_col:
+        _launch_button("🚀 Start Free Scan", "cta_launch")
+
+    # ─── FOOTER ────────────────────────────────────────────────────────────────
+    st.markdown(_PAGE_BOTTOM_HTML, unsafe_allow_html=True)
 
-    return nav_launch or hero_launch or cta_launch
+    return LandingEvent(False, False, False)
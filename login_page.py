@@ -12,8 +12,9 @@ Usage in app.py:
 """
 
 import streamlit as st
-import json, os, re, hashlib
+import json, os, re, hashlib, hmac, tempfile, threading, time, warnings
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 
 # ── Optional secure deps (graceful fallback for demo) ────────────────────────
 try:
@@ -28,8 +29,33 @@ try:
 except ImportError:
     _JWT = False
 
+try:
+    import orjson
+    _ORJSON = True
+except ImportError:
+    _ORJSON = False
+
+
+def _env_bcrypt_cost(default: int = 10) -> int:
+    """VULNSAGE_BCRYPT_COST, or the default if it is not an int bcrypt accepts (4-31)."""
+    raw = os.environ.get("VULNSAGE_BCRYPT_COST", "").strip()
+    if not raw:
+        return default
+    try:
+        cost = int(raw)
+    except ValueError:
+        cost = None
+    if cost is None or not 4 <= cost <= 31:
+        warnings.warn(f"VULNSAGE_BCRYPT_COST={raw!r} is not an integer in 4-31; using {default}.")
+        return default
+    return cost
+
+
 JWT_SECRET  = os.environ.get("VULNSAGE_JWT_SECRET", "vulnsage-dev-secret-change-me")
 JWT_EXPIRY  = 24  # hours
+BCRYPT_COST = _env_bcrypt_cost()  # log2 rounds for new hashes
+USERS_FILE  = "users.json"
+USERS_PRETTY = bool(os.environ.get("VULNSAGE_USERS_PRETTY"))  # indent users.json for hand-editing
 
 # ── Default users ─────────────────────────────────────────────────────────────
 DEFAULT_USERS = {
@@ -239,7 +265,6 @@ html, body,
 }
 
 /* ── PRIMARY BUTTON ────────────────────────────────────────────── */
-div.vs-btn-primary > button,
 .stFormSubmitButton > button {
     background: linear-gradient(135deg,#00caf5,#7c3aed) !important;
     color: #fff !important;
@@ -254,15 +279,16 @@ div.vs-btn-primary > button,
     box-shadow: 0 8px 24px rgba(0,200,245,.25), 0 0 40px rgba(124,58,237,.15) !important;
     position: relative; overflow: hidden;
 }
-div.vs-btn-primary > button:hover {
+.stFormSubmitButton > button[kind="primaryFormSubmit"]:hover {
     transform: translateY(-2px) !important;
     box-shadow: 0 14px 36px rgba(0,200,245,.38), 0 0 60px rgba(124,58,237,.25) !important;
 }
-div.vs-btn-primary > button:active { transform: translateY(1px) !important; }
+.stFormSubmitButton > button[kind="primaryFormSubmit"]:active { transform: translateY(1px) !important; }
 
 /* ── SECONDARY BUTTON ──────────────────────────────────────────── */
-div.vs-btn-secondary > button {
+.stFormSubmitButton > button[kind="secondaryFormSubmit"] {
     background: rgba(255,255,255,.03) !important;
+    box-shadow: none !important;
     color: #8aa0b8 !important;
     border: 1px solid rgba(0,220,255,.18) !important;
     border-radius: 8px !important;
@@ -273,7 +299,7 @@ div.vs-btn-secondary > button {
     letter-spacing: .04em !important;
     transition: all .25s !important;
 }
-div.vs-btn-secondary > button:hover {
+.stFormSubmitButton > button[kind="secondaryFormSubmit"]:hover {
     border-color: rgba(0,220,255,.45) !important;
     color: #00dcff !important;
     background: rgba(0,220,255,.06) !important;
@@ -281,7 +307,10 @@ div.vs-btn-secondary > button:hover {
 }
 
 /* ── GHOST / SOCIAL BUTTONS ────────────────────────────────────── */
-div.vs-btn-social > button {
+/* Keyed buttons are targeted through the st-key-<key> class that
+   Streamlit 1.39+ puts on their container (see requirements.txt). */
+.st-key-l_google button, .st-key-l_github button,
+.st-key-r_google button, .st-key-r_github button {
     background: rgba(255,255,255,.03) !important;
     color: #8aa0b8 !important;
     border: 1px solid rgba(255,255,255,.08) !important;
@@ -291,7 +320,8 @@ div.vs-btn-social > button {
     font-size: .82rem !important;
     transition: all .2s !important;
 }
-div.vs-btn-social > button:hover {
+.st-key-l_google button:hover, .st-key-l_github button:hover,
+.st-key-r_google button:hover, .st-key-r_github button:hover {
     border-color: rgba(255,255,255,.2) !important;
     color: #d4e0ef !important;
     background: rgba(255,255,255,.06) !important;
@@ -370,7 +400,7 @@ div.vs-btn-social > button:hover {
 .vs-feat-title { color:#c4d4e4; font-weight:600; font-size:.82rem; display:block; margin-bottom:2px; }
 
 /* ── TOP BAR ───────────────────────────────────────────────────── */
-div.vs-home-btn > button {
+.st-key-login_home button, .st-key-reg_home button {
     background: rgba(255,255,255,.03) !important;
     color: #5a7090 !important;
     border: 1px solid rgba(255,255,255,.07) !important;
@@ -383,7 +413,7 @@ div.vs-home-btn > button {
     padding: 0 16px !important;
     transition: all .2s !important;
 }
-div.vs-home-btn > button:hover {
+.st-key-login_home button:hover, .st-key-reg_home button:hover {
     border-color: rgba(0,220,255,.3) !important;
     color: #00dcff !important;
 }
@@ -415,7 +445,7 @@ div.vs-home-btn > button:hover {
 [data-testid="stSidebar"] label { color:#5a7090 !important; font-size:.78rem !important; }
 [data-testid="stSidebar"] hr { border-color:rgba(0,220,255,.06) !important; }
 
-div.vs-logout-btn > button {
+.st-key-logout_btn button {
     background: rgba(255,50,80,.07) !important;
     color: #ff8fab !important;
     border: 1px solid rgba(255,50,80,.18) !important;
@@ -425,7 +455,7 @@ div.vs-logout-btn > button {
     letter-spacing: .06em !important;
     width: 100% !important; transition: all .2s !important;
 }
-div.vs-logout-btn > button:hover {
+.st-key-logout_btn button:hover {
     background: rgba(255,50,80,.14) !important;
     border-color: rgba(255,50,80,.38) !important;
 }
@@ -436,36 +466,120 @@ div.vs-logout-btn > button:hover {
     .vs-title { font-size:1.25rem !important; }
     .vs-side  { padding:24px 18px !important; margin-top:16px; }
 }
+
+/* ── REDUCED MOTION ────────────────────────────────────────────── */
+@media (prefers-reduced-motion: reduce) {
+    .stApp::before, .vs-blob-1, .vs-blob-2,
+    .vs-scan-beam, .vs-scan-beam-2,
+    .vs-logo-spin, .vs-status-dot, .vs-warn > span {
+        animation: none !important;
+    }
+    .vs-scan-beam, .vs-scan-beam-2 { display: none; }
+}
+/* Touch-only devices: keep the backdrop static behind the form */
+@media (hover: none) and (pointer: coarse) {
+    .stApp::before, .vs-blob-1, .vs-blob-2 { animation: none; }
+}
 </style>
 """
 
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a <style> block."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE.sub(" ", css)
+    css = _CSS_PUNCT.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+# Minified stylesheet + scan beams + blobs shared by the login and register
+# pages, emitted as one markdown element instead of three.
+_AUTH_BACKDROP_HTML = _minify_css(AUTH_CSS) + (
+    '<div class="vs-scan-beam"></div><div class="vs-scan-beam-2"></div>'
+    '<div class="vs-blob vs-blob-1"></div><div class="vs-blob vs-blob-2"></div>'
+)
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  AUTH HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
+def _scrypt(password: str, salt: bytes) -> str:
+    return hashlib.scrypt(password.encode(), salt=salt, n=2**14, r=8, p=1, dklen=32).hex()
+
+
 def _hash_password(password: str) -> str:
     if _BCRYPT:
-        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(12)).decode()
-    return hashlib.sha256(password.encode()).hexdigest()
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_COST)).decode()
+    salt = os.urandom(16)
+    return f"scrypt${salt.hex()}${_scrypt(password, salt)}"
 
 
 def _verify_password(password: str, hashed: str) -> bool:
     if _BCRYPT and hashed.startswith(("$2a$", "$2b$", "$2y$")):
+        # checkpw runs the full key schedule before noticing a truncated or
+        # padded hash; a real one is always 60 chars.
+        if len(hashed) != 60:
+            return False
         try:
             return bcrypt.checkpw(password.encode(), hashed.encode())
         except Exception:
             return False
-    # fallback SHA-256 or plain MD5
-    return (hashlib.sha256(password.encode()).hexdigest() == hashed or
-            hashlib.md5(password.encode()).hexdigest() == hashed)
+    if hashed.startswith("scrypt$"):
+        try:
+            _, salt, digest = hashed.split("$")
+            return hmac.compare_digest(_scrypt(password, bytes.fromhex(salt)), digest)
+        except ValueError:
+            return False
+    # legacy unsalted SHA-256, or plain MD5 for 32-char digests
+    if len(hashed) == 32:
+        return hmac.compare_digest(hashlib.md5(password.encode()).hexdigest(), hashed)
+    return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), hashed)
+
+
+def _needs_rehash(hashed: str) -> bool:
+    """Unsalted SHA-256/MD5 digests are upgraded to the current scheme on next login."""
+    return len(hashed) in (32, 64) and "$" not in hashed
+
+
+# Memoized password checks, keyed on the stored hash plus an HMAC of the
+# submitted password under a per-process key, so repeat submits skip the
+# bcrypt/scrypt work without keeping a reusable password digest around.
+_VERIFY_MEMO = {}
+_VERIFY_MEMO_SIZE = 256
+_VERIFY_MEMO_KEY = os.urandom(32)
+_VERIFY_MEMO_LOCK = threading.Lock()  # sessions are threads sharing this memo
+
+
+def _verify_password_memo(password: str, hashed: str) -> bool:
+    key = (hashed, hmac.new(_VERIFY_MEMO_KEY, password.encode(), hashlib.sha256).digest())
+    hit = _VERIFY_MEMO.get(key)
+    if hit is not None:
+        return hit
+    ok = _verify_password(password, hashed)
+    with _VERIFY_MEMO_LOCK:
+        if len(_VERIFY_MEMO) >= _VERIFY_MEMO_SIZE:
+            _VERIFY_MEMO.pop(next(iter(_VERIFY_MEMO)))
+        _VERIFY_MEMO[key] = ok
+    return ok
+
+
+_RE_UPPER = re.compile(r'[A-Z]')
+_RE_LOWER = re.compile(r'[a-z]')
+_RE_DIGIT = re.compile(r'\d')
+_RE_SYMBOL = re.compile(r'[^A-Za-z0-9]')
+_RE_EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
 
 
 def _password_strength(pw: str):
     """Returns (score 0-4, label, colour)."""
     score = 0
     if len(pw) >= 8:            score += 1
-    if re.search(r'[A-Z]', pw) and re.search(r'[a-z]', pw): score += 1
-    if re.search(r'\d', pw):    score += 1
-    if re.search(r'[^A-Za-z0-9]', pw): score += 1
+    if _RE_UPPER.search(pw) and _RE_LOWER.search(pw): score += 1
+    if _RE_DIGIT.search(pw):    score += 1
+    if _RE_SYMBOL.search(pw):   score += 1
     labels = ["", "Weak", "Fair", "Good", "Strong"]
     colours = ["", "#ff4d6a", "#ffb340", "#70e0a0", "#00e5a0"]
     return score, labels[score], colours[score]
@@ -489,31 +603,101 @@ def _verify_jwt(token: str):
 
 
 def _validate_email(email: str) -> bool:
-    return bool(re.match(r'^[^@\s]+@[^@\s]+\.[^@\s]+$', email.strip()))
+    return bool(_RE_EMAIL.match(email.strip()))
 
 
 # ── User store ────────────────────────────────────────────────────────────────
-def _load_users() -> dict:
-    if os.path.exists("users.json"):
+# Parsed users.json, reused until the file's (mtime, size) changes on disk.
+_USERS_CACHE = None
+_USERS_STAT  = None
+
+
+def _copy_users(users) -> dict:
+    """Copy down to the per-user records, so edits never reach the cache."""
+    return {k: dict(v) for k, v in users.items()}
+
+
+def _users_stat():
+    try:
+        info = os.stat(USERS_FILE)
+    except OSError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
+def _dump_users(users: dict) -> bytes:
+    if _ORJSON:
+        return orjson.dumps(users, option=orjson.OPT_INDENT_2 if USERS_PRETTY else 0)
+    if USERS_PRETTY:
+        return json.dumps(users, indent=2).encode()
+    return json.dumps(users, separators=(",", ":")).encode()
+
+
+def _write_users(users: dict) -> bool:
+    global _USERS_CACHE, _USERS_STAT
+    # The cache holds its own copies of the records (see _copy_users), so an
+    # in-place edit by the caller always shows up as a difference here.
+    if _USERS_CACHE is not None and users == _USERS_CACHE and _users_stat() == _USERS_STAT:
+        return True  # nothing changed on disk or in memory
+    tmp = None
+    try:
+        data = _dump_users(users)
+        # Write beside the real file and swap it in, so a crash mid-write can
+        # never leave readers with truncated JSON (and a silent reset to defaults).
+        # Each write gets its own temp file: sessions are threads in one process.
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(USERS_FILE)),
+                                   prefix=".users-", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the mode users.json already had.
+        try:
+            os.chmod(tmp, os.stat(USERS_FILE).st_mode & 0o777)
+        except OSError:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, USERS_FILE)
+    except Exception:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        return False
+    _USERS_CACHE, _USERS_STAT = _copy_users(users), _users_stat()
+    return True
+
+
+def _load_users(readonly: bool = False) -> dict:
+    """readonly=True returns an uncopied read-only view of the cached users."""
+    global _USERS_CACHE, _USERS_STAT
+    stat = _users_stat()
+    if _USERS_CACHE is not None and stat == _USERS_STAT:
+        return MappingProxyType(_USERS_CACHE) if readonly else _copy_users(_USERS_CACHE)
+    if stat is not None:
         try:
-            with open("users.json") as f:
-                users = json.load(f)
+            with open(USERS_FILE, "rb") as f:
+                info = os.fstat(f.fileno())
+                raw = f.read()
+            users = orjson.loads(raw) if _ORJSON else json.loads(raw)
+            # Stamp the cache with the file actually parsed, not the one stat'ed.
+            stat = (info.st_mtime_ns, info.st_size)
             updated = False
             for k, v in DEFAULT_USERS.items():
                 if k not in users:
-                    users[k] = v; updated = True
+                    users[k] = dict(v); updated = True
             if updated:
-                with open("users.json", "w") as f:
-                    json.dump(users, f, indent=2)
+                _write_users(users)
+            else:
+                _USERS_CACHE, _USERS_STAT = _copy_users(users), stat
             return users
         except Exception:
             pass
-    defaults = DEFAULT_USERS.copy()
-    try:
-        with open("users.json", "w") as f:
-            json.dump(defaults, f, indent=2)
-    except Exception:
-        pass
+    defaults = _copy_users(DEFAULT_USERS)
+    if not _write_users(defaults) and stat is None:
+        # Read-only deploy with no users.json: serve the defaults from memory
+        # instead of retrying the write on every call.
+        _USERS_CACHE, _USERS_STAT = _copy_users(defaults), None
     return defaults
 
 
@@ -525,25 +709,46 @@ def _normalize_email(email: str) -> str:
     return str(email or "").strip().lower()
 
 
-def _username_exists(users: dict, username: str, exclude_username: str = "") -> bool:
+# Normalized username/email lookups, rebuilt only when the users cache is.
+_USERS_INDEX = None
+
+
+def _index_users(users):
+    """Returns ({normalized username: key}, {normalized email: [normalized usernames]})."""
+    by_name, by_email = {}, {}
+    for uname, data in users.items():
+        norm = _normalize_username(uname)
+        by_name.setdefault(norm, uname)
+        by_email.setdefault(_normalize_email(data.get("email", "")), []).append(norm)
+    return by_name, by_email
+
+
+def _users_index():
+    """_index_users() over the current users cache, memoized per cache object."""
+    global _USERS_INDEX
+    users = _load_users(readonly=True)
+    # Read the cache once: another session may swap it in at any point, and
+    # the index must be built from the very object it is tagged with.
+    cache = _USERS_CACHE
+    if cache is None:
+        return _index_users(users)
+    index = _USERS_INDEX
+    if index is not None and index[0] is cache:
+        return index[1], index[2]
+    by_name, by_email = _index_users(cache)
+    _USERS_INDEX = (cache, by_name, by_email)
+    return by_name, by_email
+
+
+def _username_exists(username: str, exclude_username: str = "") -> bool:
     target = _normalize_username(username)
-    exclude = _normalize_username(exclude_username)
-    for existing in users.keys():
-        norm = _normalize_username(existing)
-        if norm == target and norm != exclude:
-            return True
-    return False
+    return target != _normalize_username(exclude_username) and target in _users_index()[0]
 
 
-def _email_in_use(users: dict, email: str, exclude_username: str = "") -> bool:
-    target = _normalize_email(email)
+def _email_in_use(email: str, exclude_username: str = "") -> bool:
     exclude = _normalize_username(exclude_username)
-    for uname, data in users.items():
-        if _normalize_username(uname) == exclude:
-            continue
-        if _normalize_email(data.get("email", "")) == target:
-            return True
-    return False
+    owners = _users_index()[1].get(_normalize_email(email), ())
+    return any(owner != exclude for owner in owners)
 
 
 def load_users() -> dict:
@@ -553,18 +758,13 @@ def load_users() -> dict:
     return _load_users()
 
 
-def _save_user(username, password, role="user", name="", email="") -> bool:
-    users = _load_users()
+def _save_user(username, password, role="user", name="", email="", users=None) -> bool:
+    users = _load_users() if users is None else users
     users[username] = {
         "password": _hash_password(password),
         "role": role, "name": name or username, "email": email.strip(),
     }
-    try:
-        with open("users.json", "w") as f:
-            json.dump(users, f, indent=2)
-        return True
-    except Exception:
-        return False
+    return _write_users(users)
 
 
 def update_user_profile(
@@ -578,12 +778,9 @@ def update_user_profile(
     Returns: (success: bool, message: str, updated_user: dict|None, resolved_username: str|None)
     """
     users = _load_users()
-
-    current_key = None
-    for uname in users.keys():
-        if _normalize_username(uname) == _normalize_username(current_username):
-            current_key = uname
-            break
+    # Resolve the key in the dict being edited; the shared index may already
+    # reflect a newer save.
+    current_key = _index_users(users)[0].get(_normalize_username(current_username))
 
     if not current_key:
         return False, "User not found.", None, None
@@ -596,9 +793,9 @@ def update_user_profile(
         return False, "Username must be at least 3 characters.", None, None
     if not _validate_email(new_email):
         return False, "Enter a valid email address.", None, None
-    if _username_exists(users, new_username, exclude_username=current_key):
+    if _username_exists(new_username, exclude_username=current_key):
         return False, "Username already exists.", None, None
-    if _email_in_use(users, new_email, exclude_username=current_key):
+    if _email_in_use(new_email, exclude_username=current_key):
         return False, "Email already in use.", None, None
 
     existing = users[current_key]
@@ -617,20 +814,21 @@ def update_user_profile(
         users[current_key] = updated
         resolved_username = current_key
 
-    try:
-        with open("users.json", "w") as f:
-            json.dump(users, f, indent=2)
+    if _write_users(users):
         return True, "Profile updated successfully.", updated, resolved_username
-    except Exception:
-        return False, "Could not save profile changes.", None, None
+    return False, "Could not save profile changes.", None, None
 
 
 def _verify_credentials(username: str, password: str):
-    users = _load_users()
+    users = _load_users(readonly=True)
     if username not in users:
         return False, None
     stored = users[username]["password"]
-    if _verify_password(password, stored):
+    if _verify_password_memo(password, stored):
+        if _needs_rehash(stored):
+            users = dict(users)
+            users[username] = {**users[username], "password": _hash_password(password)}
+            _write_users(users)
         return True, users[username]
     return False, None
 
@@ -647,8 +845,7 @@ def _authenticate(username: str, password: str):
 # ══════════════════════════════════════════════════════════════════════════════
 #  COMPONENTS
 # ══════════════════════════════════════════════════════════════════════════════
-def _logo_html():
-    return """
+_LOGO_HTML = """
     <div class="vs-logo-wrap">
       <div class="vs-logo-icon">
         <div class="vs-logo-bg"></div>
@@ -663,15 +860,94 @@ def _logo_html():
       </div>
     </div>"""
 
-
-def _security_badges():
-    return """
+_SECURITY_BADGES_HTML = """
     <div class="vs-badges">
       <span class="vs-badge vs-badge-bcrypt">🔒 bcrypt</span>
       <span class="vs-badge vs-badge-jwt">🛡 JWT</span>
       <span class="vs-badge vs-badge-tls">🔐 TLS 1.3</span>
     </div>"""
 
+_STATUS_HTML = ('<div style="text-align:right;padding-top:2px"><span class="vs-status">'
+                '<span class="vs-status-dot"></span>Systems Online</span></div>')
+
+# Card headers carry their own 6px spacer so each is a single element.
+_LOGIN_CARD_HTML = (f'<div class="vs-card">{_LOGO_HTML}'
+                    '<div class="vs-eyebrow">// Secure Access Portal</div>'
+                    '<h1 class="vs-title">Welcome Back</h1>'
+                    '<p class="vs-sub">Sign in to your security dashboard</p>'
+                    "</div><div style='height:6px'></div>")
+
+_REGISTER_CARD_HTML = (f'<div class="vs-card">{_LOGO_HTML}'
+                       '<div class="vs-eyebrow">// Create Your Account</div>'
+                       '<h1 class="vs-title">Get Started</h1>'
+                       '<p class="vs-sub">Join VulnSage — scan smarter, defend faster</p>'
+                       "</div><div style='height:6px'></div>" + """
+<div style="background:rgba(0,220,255,.03);border:1px solid rgba(0,220,255,.09);border-radius:10px;
+     padding:12px 14px;font-family:'Syne Mono',monospace;font-size:.65rem;color:#5a7090;margin-bottom:10px;">
+  <div style="color:#00dcff;font-size:.58rem;letter-spacing:.18em;text-transform:uppercase;margin-bottom:7px">
+    // Password Requirements
+  </div>
+  Minimum 8 characters · Uppercase + lowercase · At least one digit · One special character
+</div>""")
+
+_SIDE_PANEL_HTML = """
+<div class="vs-side" style="margin-top:52px">
+  <div style="text-align:center;margin-bottom:18px">
+    <div style="font-size:2.2rem;margin-bottom:8px">🧠</div>
+    <div style="font-family:'Space Grotesk',sans-serif;font-size:1rem;font-weight:700;color:#e0eaf5;letter-spacing:.02em">
+      AI-Powered Threat Intelligence
+    </div>
+    <div style="font-family:'DM Sans',sans-serif;font-size:.76rem;color:#4a6070;margin-top:6px;line-height:1.6">
+      VulnSage performs automated web security analysis using AI-driven risk evaluation and intelligent vulnerability classification.
+    </div>
+  </div>
+
+  <div class="vs-feat"><div class="vs-feat-dot"></div>
+    <div class="vs-feat-text">
+      <span class="vs-feat-title">Automated Vulnerability Scanning</span>
+      Detects misconfigurations, insecure headers, exposed endpoints, and common OWASP Top 10 risks.
+    </div>
+  </div>
+
+  <div class="vs-feat"><div class="vs-feat-dot"></div>
+    <div class="vs-feat-text">
+      <span class="vs-feat-title">AI Risk Classification</span>
+      Machine learning model categorizes findings into Critical, High, Medium, and Low severity levels.
+    </div>
+  </div>
+
+  <div class="vs-feat"><div class="vs-feat-dot"></div>
+    <div class="vs-feat-text">
+      <span class="vs-feat-title">LLM-Powered Analysis</span>
+      Generates human-readable security reports with actionable remediation guidance.
+    </div>
+  </div>
+
+  <div class="vs-feat"><div class="vs-feat-dot"></div>
+    <div class="vs-feat-text">
+      <span class="vs-feat-title">Real-Time Security Assessment</span>
+      Performs live scanning and instant report generation via Streamlit dashboard.
+    </div>
+  </div>
+
+  <div class="vs-feat"><div class="vs-feat-dot"></div>
+    <div class="vs-feat-text">
+      <span class="vs-feat-title">Comprehensive Reporting</span>
+      Executive summary, risk breakdown, and structured vulnerability insights.
+    </div>
+  </div>
+
+  <div style="margin-top:22px;padding:14px;background:rgba(0,229,160,.04);border:1px solid rgba(0,229,160,.1);border-radius:10px;">
+    <div style="font-family:'Syne Mono',monospace;font-size:.58rem;letter-spacing:.18em;text-transform:uppercase;color:#00e5a0;opacity:.8;margin-bottom:8px">// Security Standards</div>
+    <div style="display:flex;gap:8px;flex-wrap:wrap">
+      <span style="font-family:'Syne Mono',monospace;font-size:.6rem;padding:3px 8px;border-radius:999px;background:rgba(0,229,160,.07);border:1px solid rgba(0,229,160,.15);color:#00e5a0">OWASP Top 10</span>
+      <span style="font-family:'Syne Mono',monospace;font-size:.6rem;padding:3px 8px;border-radius:999px;background:rgba(0,220,255,.07);border:1px solid rgba(0,220,255,.15);color:#00dcff">AI Risk Engine</span>
+      <span style="font-family:'Syne Mono',monospace;font-size:.6rem;padding:3px 8px;border-radius:999px;background:rgba(139,92,246,.07);border:1px solid rgba(139,92,246,.15);color:#a78bfa">Real-Time Analysis</span>
+    </div>
+  </div>
+</div>
+"""
+
 
 def _pw_strength_html(score, label, colour):
     segs = ""
@@ -687,25 +963,18 @@ def _pw_strength_html(score, label, colour):
 #  LOGIN PAGE
 # ══════════════════════════════════════════════════════════════════════════════
 def show_login_page():
-    st.markdown(AUTH_CSS, unsafe_allow_html=True)
-
-    # Landing-style moving scan lines
-    st.markdown('<div class="vs-scan-beam"></div><div class="vs-scan-beam-2"></div>', unsafe_allow_html=True)
-
-    # Blobs
-    st.markdown('<div class="vs-blob vs-blob-1"></div><div class="vs-blob vs-blob-2"></div>', unsafe_allow_html=True)
+    # Styles, landing-style moving scan lines and blobs
+    st.markdown(_AUTH_BACKDROP_HTML, unsafe_allow_html=True)
 
     # Top bar
     top_l, top_r = st.columns([1, 5])
     with top_l:
-        st.markdown('<div class="vs-home-btn">', unsafe_allow_html=True)
         if st.button("← Home", key="login_home"):
             st.session_state.page = "landing"
             st.session_state.show_register = False
             st.rerun()
-        st.markdown('</div>', unsafe_allow_html=True)
     with top_r:
-        st.markdown('<div style="text-align:right;padding-top:2px"><span class="vs-status"><span class="vs-status-dot"></span>Systems Online</span></div>', unsafe_allow_html=True)
+        st.markdown(_STATUS_HTML, unsafe_allow_html=True)
 
     # Direct-login warning
     if st.session_state.get("direct_login_attempt"):
@@ -720,13 +989,7 @@ def show_login_page():
 
     # ── LEFT CARD ──
     with card_col:
-        st.markdown(f'<div class="vs-card">{_logo_html()}'
-                    '<div class="vs-eyebrow">// Secure Access Portal</div>'
-                    '<h1 class="vs-title">Welcome Back</h1>'
-                    '<p class="vs-sub">Sign in to your security dashboard</p>'
-                    '</div>', unsafe_allow_html=True)
-
-        st.markdown("<div style='height:6px'></div>", unsafe_allow_html=True)
+        st.markdown(_LOGIN_CARD_HTML, unsafe_allow_html=True)
 
         with st.form("login_form", clear_on_submit=False):
             username = st.text_input("Email / Username", placeholder="admin  or  admin@vulnsage.io", key="l_user")
@@ -736,104 +999,41 @@ def show_login_page():
             st.markdown("<div style='height:2px'></div>", unsafe_allow_html=True)
             col_a, col_b = st.columns(2)
             with col_a:
-                st.markdown('<div class="vs-btn-primary">', unsafe_allow_html=True)
-                sign_in = st.form_submit_button("⚡ Authenticate", use_container_width=True)
-                st.markdown("</div>", unsafe_allow_html=True)
+                sign_in = st.form_submit_button("⚡ Authenticate", type="primary", use_container_width=True)
             with col_b:
-                st.markdown('<div class="vs-btn-secondary">', unsafe_allow_html=True)
                 go_reg = st.form_submit_button("✦ Register", use_container_width=True)
-                st.markdown("</div>", unsafe_allow_html=True)
 
         # Social login row
         st.markdown('<div class="vs-divider">or continue with</div>', unsafe_allow_html=True)
         sc1, sc2 = st.columns(2)
         with sc1:
-            st.markdown('<div class="vs-btn-social">', unsafe_allow_html=True)
             if st.button("🔵  Google", key="l_google", use_container_width=True):
                 st.info("Google OAuth — connect your provider in settings.")
-            st.markdown("</div>", unsafe_allow_html=True)
         with sc2:
-            st.markdown('<div class="vs-btn-social">', unsafe_allow_html=True)
             if st.button("⚫  GitHub", key="l_github", use_container_width=True):
                 st.info("GitHub OAuth — connect your provider in settings.")
-            st.markdown("</div>", unsafe_allow_html=True)
 
        
 
-        st.markdown(_security_badges(), unsafe_allow_html=True)
+        st.markdown(_SECURITY_BADGES_HTML, unsafe_allow_html=True)
 
     # ── RIGHT: Security side panel ──
     with side_col:
-        st.markdown("""
-<div class="vs-side" style="margin-top:52px">
-  <div style="text-align:center;margin-bottom:18px">
-    <div style="font-size:2.2rem;margin-bottom:8px">🧠</div>
-    <div style="font-family:'Space Grotesk',sans-serif;font-size:1rem;font-weight:700;color:#e0eaf5;letter-spacing:.02em">
-      AI-Powered Threat Intelligence
-    </div>
-    <div style="font-family:'DM Sans',sans-serif;font-size:.76rem;color:#4a6070;margin-top:6px;line-height:1.6">
-      VulnSage performs automated web security analysis using AI-driven risk evaluation and intelligent vulnerability classification.
-    </div>
-  </div>
-
-  <div class="vs-feat"><div class="vs-feat-dot"></div>
-    <div class="vs-feat-text">
-      <span class="vs-feat-title">Automated Vulnerability Scanning</span>
-      Detects misconfigurations, insecure headers, exposed endpoints, and common OWASP Top 10 risks.
-    </div>
-  </div>
-
-  <div class="vs-feat"><div class="vs-feat-dot"></div>
-    <div class="vs-feat-text">
-      <span class="vs-feat-title">AI Risk Classification</span>
-      Machine learning model categorizes findings into Critical, High, Medium, and Low severity levels.
-    </div>
-  </div>
-
-  <div class="vs-feat"><div class="vs-feat-dot"></div>
-    <div class="vs-feat-text">
-      <span class="vs-feat-title">LLM-Powered Analysis</span>
-      Generates human-readable security reports with actionable remediation guidance.
-    </div>
-  </div>
-
-  <div class="vs-feat"><div class="vs-feat-dot"></div>
-    <div class="vs-feat-text">
-      <span class="vs-feat-title">Real-Time Security Assessment</span>
-      Performs live scanning and instant report generation via Streamlit dashboard.
-    </div>
-  </div>
-
-  <div class="vs-feat"><div class="vs-feat-dot"></div>
-    <div class="vs-feat-text">
-      <span class="vs-feat-title">Comprehensive Reporting</span>
-      Executive summary, risk breakdown, and structured vulnerability insights.
-    </div>
-  </div>
-
-  <div style="margin-top:22px;padding:14px;background:rgba(0,229,160,.04);border:1px solid rgba(0,229,160,.1);border-radius:10px;">
-    <div style="font-family:'Syne Mono',monospace;font-size:.58rem;letter-spacing:.18em;text-transform:uppercase;color:#00e5a0;opacity:.8;margin-bottom:8px">// Security Standards</div>
-    <div style="display:flex;gap:8px;flex-wrap:wrap">
-      <span style="font-family:'Syne Mono',monospace;font-size:.6rem;padding:3px 8px;border-radius:999px;background:rgba(0,229,160,.07);border:1px solid rgba(0,229,160,.15);color:#00e5a0">OWASP Top 10</span>
-      <span style="font-family:'Syne Mono',monospace;font-size:.6rem;padding:3px 8px;border-radius:999px;background:rgba(0,220,255,.07);border:1px solid rgba(0,220,255,.15);color:#00dcff">AI Risk Engine</span>
-      <span style="font-family:'Syne Mono',monospace;font-size:.6rem;padding:3px 8px;border-radius:999px;background:rgba(139,92,246,.07);border:1px solid rgba(139,92,246,.15);color:#a78bfa">Real-Time Analysis</span>
-    </div>
-  </div>
-</div>
-""", unsafe_allow_html=True)
+        st.markdown(_SIDE_PANEL_HTML, unsafe_allow_html=True)
 
     # ── Form handlers ──
     if sign_in:
         if not username or not password:
             st.warning("⚠️ Both username and password are required.")
         else:
-            valid, info = _authenticate(username.strip(), password)
+            with st.spinner("Authenticating..."):
+                valid, info = _authenticate(username.strip(), password)
             if valid:
                 st.session_state.authenticated = True
                 st.session_state.username = username.strip()
                 st.session_state.user_info = info
                 st.session_state.jwt_token = info.get("token", "")
-                st.session_state.login_time = datetime.now().isoformat()
+                st.session_state.login_time = time.time()  # epoch seconds; format at display time
                 st.session_state.direct_login_attempt = False
                 st.success(f"✅ Access granted — welcome, **{info['name']}**!")
                 st.balloons()
@@ -850,44 +1050,23 @@ def show_login_page():
 #  REGISTER PAGE
 # ══════════════════════════════════════════════════════════════════════════════
 def show_register_page():
-    st.markdown(AUTH_CSS, unsafe_allow_html=True)
-
-    # Landing-style moving scan lines
-    st.markdown('<div class="vs-scan-beam"></div><div class="vs-scan-beam-2"></div>', unsafe_allow_html=True)
-
-    st.markdown('<div class="vs-blob vs-blob-1"></div><div class="vs-blob vs-blob-2"></div>', unsafe_allow_html=True)
+    # Styles, landing-style moving scan lines and blobs
+    st.markdown(_AUTH_BACKDROP_HTML, unsafe_allow_html=True)
 
     # Top bar
     top_l, top_r = st.columns([1, 5])
     with top_l:
-        st.markdown('<div class="vs-home-btn">', unsafe_allow_html=True)
         if st.button("← Home", key="reg_home"):
             st.session_state.page = "landing"
             st.session_state.show_register = False
             st.rerun()
-        st.markdown("</div>", unsafe_allow_html=True)
     with top_r:
-        st.markdown('<div style="text-align:right;padding-top:2px"><span class="vs-status"><span class="vs-status-dot"></span>Systems Online</span></div>', unsafe_allow_html=True)
+        st.markdown(_STATUS_HTML, unsafe_allow_html=True)
 
     _, col, _ = st.columns([0.6, 1.1, 0.6])
     with col:
-        st.markdown(f'<div class="vs-card">{_logo_html()}'
-                    '<div class="vs-eyebrow">// Create Your Account</div>'
-                    '<h1 class="vs-title">Get Started</h1>'
-                    '<p class="vs-sub">Join VulnSage — scan smarter, defend faster</p>'
-                    '</div>', unsafe_allow_html=True)
-
-        st.markdown("<div style='height:6px'></div>", unsafe_allow_html=True)
-
-        # Password requirements box
-        st.markdown("""
-        <div style="background:rgba(0,220,255,.03);border:1px solid rgba(0,220,255,.09);border-radius:10px;
-             padding:12px 14px;font-family:'Syne Mono',monospace;font-size:.65rem;color:#5a7090;margin-bottom:10px;">
-          <div style="color:#00dcff;font-size:.58rem;letter-spacing:.18em;text-transform:uppercase;margin-bottom:7px">
-            // Password Requirements
-          </div>
-          Minimum 8 characters · Uppercase + lowercase · At least one digit · One special character
-        </div>""", unsafe_allow_html=True)
+        # Card header + password requirements box
+        st.markdown(_REGISTER_CARD_HTML, unsafe_allow_html=True)
 
         with st.form("register_form", clear_on_submit=False):
             new_name  = st.text_input("Full Name",        placeholder="Your Name",        key="r_name")
@@ -913,29 +1092,21 @@ def show_register_page():
             st.markdown("<div style='height:4px'></div>", unsafe_allow_html=True)
             ca, cb = st.columns(2)
             with ca:
-                st.markdown('<div class="vs-btn-primary">', unsafe_allow_html=True)
-                create = st.form_submit_button("✅ Create Account", use_container_width=True)
-                st.markdown("</div>", unsafe_allow_html=True)
+                create = st.form_submit_button("✅ Create Account", type="primary", use_container_width=True)
             with cb:
-                st.markdown('<div class="vs-btn-secondary">', unsafe_allow_html=True)
                 back = st.form_submit_button("← Back to Login", use_container_width=True)
-                st.markdown("</div>", unsafe_allow_html=True)
 
         # Social row
         st.markdown('<div class="vs-divider">or sign up with</div>', unsafe_allow_html=True)
         sa, sb = st.columns(2)
         with sa:
-            st.markdown('<div class="vs-btn-social">', unsafe_allow_html=True)
             if st.button("🔵  Google", key="r_google", use_container_width=True):
                 st.info("Google OAuth — connect your provider in settings.")
-            st.markdown("</div>", unsafe_allow_html=True)
         with sb:
-            st.markdown('<div class="vs-btn-social">', unsafe_allow_html=True)
             if st.button("⚫  GitHub", key="r_github", use_container_width=True):
                 st.info("GitHub OAuth — connect your provider in settings.")
-            st.markdown("</div>", unsafe_allow_html=True)
 
-        st.markdown(_security_badges(), unsafe_allow_html=True)
+        st.markdown(_SECURITY_BADGES_HTML, unsafe_allow_html=True)
 
     # Handlers
     if create:
@@ -954,15 +1125,15 @@ def show_register_page():
         if not terms:
             errors.append("Please accept the Terms of Service.")
         users = _load_users()
-        if _username_exists(users, new_user):
+        if _username_exists(new_user):
             errors.append("Username already exists.")
-        if _email_in_use(users, new_email):
+        if _email_in_use(new_email):
             errors.append("Email already in use.")
 
         if errors:
             for e in errors:
                 st.error(f"❌ {e}")
-        elif _save_user(new_user, new_pass, "user", new_name, new_email):
+        elif _save_user(new_user, new_pass, "user", new_name, new_email, users=users):
             st.success("✅ Account created! Sign in with your new credentials.")
             st.balloons()
             st.session_state.show_register = False
@@ -1013,12 +1184,10 @@ def show_logout_button():
             st.session_state.dashboard_page = "dashboard" if st.session_state.get("dashboard_page") == "profile" else "profile"
             st.rerun()
 
-        st.markdown('<div class="vs-logout-btn">', unsafe_allow_html=True)
         if st.button("⏻  Sign Out", use_container_width=True, key="logout_btn"):
             for k in ["authenticated", "username", "user_info", "login_time", "jwt_token", "dashboard_page"]:
                 st.session_state.pop(k, None)
             st.rerun()
-        st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1076,7 +1245,8 @@ def auth_gate() -> bool:
 
     if not st.session_state.authenticated:
         if "page" not in st.session_state or st.session_state.get("page") == "login":
-            st.session_state.setdefault("direct_login_attempt", True)
+            if "direct_login_attempt" not in st.session_state:
+                st.session_state.direct_login_attempt = True
         if st.session_state.get("show_register"):
             show_register_page()
         else:
@@ -13,13 +13,21 @@ from __future__ import annotations
 import hashlib
 import html
 import logging
+import statistics
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 LOG = logging.getLogger(__name__)
 
@@ -54,6 +62,26 @@ SQL_ERROR_PATTERNS: List[str] = [
     "warning: sqlite",
 ]
 
+# A pattern that contains another one only matches where the shorter one
+# already does, so the per-response scan only needs the minimal set.
+_SQL_ERROR_SCAN: tuple[str, ...] = tuple(
+    pattern
+    for pattern in SQL_ERROR_PATTERNS
+    if not any(other != pattern and other in pattern for other in SQL_ERROR_PATTERNS)
+)
+
+
+def _fingerprint(content: bytes) -> str:
+    """Non-cryptographic body fingerprint; only ever compared for equality."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(content)
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _detect_sql_error(body: str) -> bool:
+    body_lower = body.lower()
+    return any(pattern in body_lower for pattern in _SQL_ERROR_SCAN)
+
 
 @dataclass(frozen=True)
 class ResponseSnapshot:
@@ -64,6 +92,7 @@ class ResponseSnapshot:
     content_length: int
     body_hash: str
     body_preview: str
+    sql_error_detected: bool = False
 
     @classmethod
     def from_response(cls, response: requests.Response, response_time: float, preview_size: int = 1000) -> "ResponseSnapshot":
@@ -72,8 +101,9 @@ class ResponseSnapshot:
             status_code=response.status_code,
             response_time=response_time,
             content_length=len(body),
-            body_hash=hashlib.sha256(body.encode("utf-8", errors="ignore")).hexdigest(),
+            body_hash=_fingerprint(response.content or b""),
             body_preview=body[:preview_size],
+            sql_error_detected=_detect_sql_error(body),
         )
 
 
@@ -103,7 +133,13 @@ class SQLInjectionResult:
 
 @dataclass(frozen=True)
 class TimeBasedSQLiResult:
-    """Result for one time-based blind SQLi test."""
+    """Result for one time-based blind SQLi test.
+
+    ``delay_delta`` and the verdict come from the median timings; the
+    averages are the plain means of the same samples. ``samples`` is the
+    number of injected requests actually sent (fewer than ``retries`` on
+    early exit).
+    """
 
     parameter: str
     payload: str
@@ -111,6 +147,9 @@ class TimeBasedSQLiResult:
     average_injected_time: float
     delay_delta: float
     likely_vulnerable: bool
+    samples: int = 0
+    median_baseline_time: float = 0.0
+    median_injected_time: float = 0.0
 
 
 class PenetrationTester:
@@ -120,9 +159,36 @@ class PenetrationTester:
     This module is intended for authorized testing only.
     """
 
-    def __init__(self, timeout: int = 10, session: Optional[requests.Session] = None) -> None:
+    def __init__(
+        self,
+        timeout: int = 10,
+        session: Optional[requests.Session] = None,
+        workers: int = 8,
+    ) -> None:
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.workers = max(1, workers)
+        if session is None:
+            session = requests.Session()
+            # Keep one pooled keep-alive connection per worker so the payload
+            # fan-out never discards connections and re-handshakes.
+            adapter = HTTPAdapter(pool_maxsize=max(self.workers, DEFAULT_POOLSIZE))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._owns_session = True
+        else:
+            self._owns_session = False
+        self.session = session
+
+    def __enter__(self) -> "PenetrationTester":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections, unless the session was supplied by the caller."""
+        if self._owns_session:
+            self.session.close()
 
     def capture_baseline(
         self,
@@ -156,37 +222,45 @@ class PenetrationTester:
             return []
 
         baseline = self.capture_baseline(url=url, params=params, method=method, headers=headers)
-        results: List[SQLInjectionResult] = []
-
-        for parameter in params.keys():
-            for payload in chosen_payloads:
-                injected_params = self._inject_param(params, parameter, payload)
-                response, elapsed = self._send_request(
-                    url=url,
-                    method=method,
-                    params=injected_params,
-                    headers=headers,
+        jobs = [
+            (parameter, payload, self._inject_param(params, parameter, payload))
+            for parameter in params.keys()
+            for payload in chosen_payloads
+        ]
+
+        # Payload requests are independent, so overlap their round-trips;
+        # map() keeps the responses in job order.
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs))) as executor:
+            responses = list(
+                executor.map(
+                    lambda job: self._send_request(url=url, method=method, params=job[2], headers=headers),
+                    jobs,
                 )
+            )
 
-                comparison = self.compare_baseline_with_response(baseline, response, elapsed)
-                reflected_xss = self.detect_reflected_xss(response.text, payload)
-
-                likely_sqli = (
-                    comparison.sql_error_detected
-                    or comparison.status_code_changed
-                    or comparison.similarity_ratio < 0.75
-                )
-
-                results.append(
-                    SQLInjectionResult(
-                        parameter=parameter,
-                        payload=payload,
-                        reflected_xss=reflected_xss,
-                        likely_sqli=likely_sqli,
-                        response_time=elapsed,
-                        comparison=comparison,
-                    )
+        results: List[SQLInjectionResult] = []
+        for (parameter, payload, _), (response, elapsed) in zip(jobs, responses):
+            # Response.text re-decodes (and may re-sniff the charset) on every access.
+            body = response.text or ""
+            comparison = self.compare_baseline_with_response(baseline, response, elapsed, body=body)
+            reflected_xss = self.detect_reflected_xss(body, payload)
+
+            likely_sqli = (
+                comparison.sql_error_detected
+                or comparison.status_code_changed
+                or comparison.similarity_ratio < 0.75
+            )
+
+            results.append(
+                SQLInjectionResult(
+                    parameter=parameter,
+                    payload=payload,
+                    reflected_xss=reflected_xss,
+                    likely_sqli=likely_sqli,
+                    response_time=elapsed,
+                    comparison=comparison,
                 )
+            )
 
         return results
 
@@ -195,19 +269,25 @@ class PenetrationTester:
         baseline: ResponseSnapshot,
         response: requests.Response,
         response_time: float,
+        body: Optional[str] = None,
     ) -> ResponseComparison:
-        """Compare baseline snapshot against a new HTTP response."""
-        body = response.text or ""
-        hash_now = hashlib.sha256(body.encode("utf-8", errors="ignore")).hexdigest()
-
-        similarity = SequenceMatcher(
-            None,
-            baseline.body_preview,
-            body[: len(baseline.body_preview)],
-        ).ratio()
-
-        body_lower = body.lower()
-        sql_error_detected = any(pattern in body_lower for pattern in SQL_ERROR_PATTERNS)
+        """Compare baseline snapshot against a new HTTP response (``body``: pre-decoded text)."""
+        if body is None:
+            body = response.text or ""
+        hash_now = _fingerprint(response.content or b"")
+
+        if hash_now == baseline.body_hash:
+            # Byte-identical body: nothing to diff or rescan.
+            similarity = 1.0
+            sql_error_detected = baseline.sql_error_detected
+        else:
+            preview = body[: len(baseline.body_preview)]
+            if preview == baseline.body_preview:
+                # Payloads that leave the page head untouched are the common case.
+                similarity = 1.0
+            else:
+                similarity = SequenceMatcher(None, baseline.body_preview, preview).ratio()
+            sql_error_detected = _detect_sql_error(body)
 
         return ResponseComparison(
             status_code_changed=response.status_code != baseline.status_code,
@@ -243,7 +323,17 @@ class PenetrationTester:
         retries: int = 3,
         min_delay_delta: float = 3.0,
     ) -> List[TimeBasedSQLiResult]:
-        """Detect potential time-based blind SQLi via repeated timing analysis."""
+        """
+        Detect potential time-based blind SQLi via repeated timing analysis.
+
+        Timings are summarised by their median so a single jittery request
+        cannot swing the verdict. Sampling for a payload stops early once a
+        majority of its ``retries`` requests have come back faster than the
+        baseline median plus ``min_delay_delta`` by more than twice the
+        baseline's MAD, since the median can then no longer reach the threshold.
+        That needs ``retries >= 3`` to save any requests: with 2, both samples
+        must be fast, so every one is sent anyway.
+        """
         chosen_payloads = list(payloads or DEFAULT_TIME_BASED_PAYLOADS)
         if not params:
             return []
@@ -262,10 +352,13 @@ class PenetrationTester:
                 )
                 baseline_times.append(elapsed)
 
-            baseline_avg = sum(baseline_times) / len(baseline_times)
+            baseline_med = statistics.median(baseline_times)
+            baseline_mad = statistics.median(abs(t - baseline_med) for t in baseline_times)
+            reject_below = baseline_med + min_delay_delta - 2 * baseline_mad
 
             for payload in chosen_payloads:
                 injected_times = []
+                fast_count = 0
                 injected_params = self._inject_param(params, parameter, payload)
 
                 for _ in range(retries):
@@ -276,19 +369,26 @@ class PenetrationTester:
                         headers=headers,
                     )
                     injected_times.append(elapsed)
+                    if elapsed < reject_below:
+                        fast_count += 1
+                        if fast_count > retries // 2:
+                            break
 
-                injected_avg = sum(injected_times) / len(injected_times)
-                delta = injected_avg - baseline_avg
+                injected_med = statistics.median(injected_times)
+                delta = injected_med - baseline_med
                 likely_vulnerable = delta >= min_delay_delta
 
                 results.append(
                     TimeBasedSQLiResult(
                         parameter=parameter,
                         payload=payload,
-                        average_baseline_time=baseline_avg,
-                        average_injected_time=injected_avg,
+                        average_baseline_time=statistics.fmean(baseline_times),
+                        average_injected_time=statistics.fmean(injected_times),
                         delay_delta=delta,
                         likely_vulnerable=likely_vulnerable,
+                        samples=len(injected_times),
+                        median_baseline_time=baseline_med,
+                        median_injected_time=injected_med,
                     )
                 )
 
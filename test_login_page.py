@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import login_page
+
+
+class LoginPageStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        login_page._USERS_CACHE = None
+        login_page._USERS_STAT = None
+        login_page._USERS_INDEX = None
+        login_page._VERIFY_MEMO.clear()
+
+    def tearDown(self) -> None:
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _write_raw_users(self, users: dict) -> None:
+        with open(login_page.USERS_FILE, "w") as f:
+            json.dump(users, f)
+
+    def _read_raw_users(self) -> dict:
+        with open(login_page.USERS_FILE) as f:
+            return json.load(f)
+
+    def test_scrypt_hash_round_trip_and_tampered_digest(self) -> None:
+        with patch.object(login_page, "_BCRYPT", False):
+            hashed = login_page._hash_password("Correct#Horse1")
+
+        self.assertTrue(hashed.startswith("scrypt$"))
+        self.assertTrue(login_page._verify_password("Correct#Horse1", hashed))
+        self.assertFalse(login_page._verify_password("correct#horse1", hashed))
+
+        tampered = hashed[:-1] + ("0" if hashed[-1] != "0" else "1")
+        self.assertFalse(login_page._verify_password("Correct#Horse1", tampered))
+
+    def test_legacy_digests_are_accepted_and_rehashed(self) -> None:
+        password = "Legacy#Pass1"
+        legacy = {
+            "md5user": hashlib.md5(password.encode()).hexdigest(),
+            "shauser": hashlib.sha256(password.encode()).hexdigest(),
+        }
+        self._write_raw_users({
+            name: {"password": digest, "role": "user", "name": name, "email": f"{name}@x.io"}
+            for name, digest in legacy.items()
+        })
+
+        for name, digest in legacy.items():
+            self.assertEqual(login_page._verify_credentials(name, "wrong")[0], False)
+            valid, _ = login_page._verify_credentials(name, password)
+            self.assertTrue(valid)
+
+            stored = self._read_raw_users()[name]["password"]
+            self.assertNotEqual(stored, digest)
+            self.assertFalse(login_page._needs_rehash(stored))
+            self.assertTrue(login_page._verify_password(password, stored))
+
+    def test_write_users_skips_unchanged_but_persists_in_place_edit(self) -> None:
+        users = login_page._load_users()
+
+        with patch.object(login_page.tempfile, "mkstemp", wraps=tempfile.mkstemp) as mkstemp:
+            self.assertTrue(login_page._write_users(login_page._load_users()))
+            mkstemp.assert_not_called()
+
+            users["admin"]["name"] = "Renamed Admin"
+            self.assertTrue(login_page._write_users(users))
+            mkstemp.assert_called_once()
+
+        self.assertEqual(self._read_raw_users()["admin"]["name"], "Renamed Admin")
+        self.assertEqual(login_page.load_users()["admin"]["name"], "Renamed Admin")
+        self.assertEqual([n for n in os.listdir(".") if n.endswith(".tmp")], [])
+
+    def test_lookups_see_user_saved_by_another_caller(self) -> None:
+        self.assertFalse(login_page._username_exists("mallory"))
+        self.assertTrue(login_page._save_user("mallory", "Pw#12345a", email="m@x.io"))
+
+        self.assertTrue(login_page._username_exists("Mallory"))
+        self.assertTrue(login_page._email_in_use("M@x.io"))
+
+    def test_lookups_see_user_saved_while_index_is_built(self) -> None:
+        login_page._users_index()
+        load_users = login_page._load_users
+        state = {"raced": False}
+
+        def load_then_race(readonly: bool = False):
+            users = load_users(readonly)
+            if readonly and not state["raced"]:
+                # Another session saves between the load and the index rebuild.
+                state["raced"] = True
+                login_page._save_user("mallory", "Pw#12345a", email="m@x.io")
+            return users
+
+        login_page._USERS_INDEX = None
+        with patch.object(login_page, "_load_users", side_effect=load_then_race):
+            login_page._users_index()
+
+        self.assertIn("mallory", login_page.load_users())
+        self.assertTrue(login_page._username_exists("mallory"))
+        self.assertTrue(login_page._email_in_use("m@x.io"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,12 +1,16 @@
+import time
 import unittest
 from unittest.mock import patch
 
+import requests
+
 from penetration_tester import PenetrationTester, ResponseSnapshot
 
 
 class FakeResponse:
     def __init__(self, text: str, status_code: int = 200, url: str = "http://target.local/test"):
         self.text = text
+        self.content = text.encode("utf-8")
         self.status_code = status_code
         self.url = url
 
@@ -38,6 +42,24 @@ class PenetrationTesterTests(unittest.TestCase):
         self.assertTrue(comparison.sql_error_detected)
         self.assertTrue(comparison.hash_changed)
 
+    def test_compare_baseline_with_response_reuses_verdict_for_identical_body(self) -> None:
+        body = "<html>Warning: mysql_fetch_array() expects parameter 1</html>"
+        baseline = ResponseSnapshot.from_response(FakeResponse(body, 200), response_time=0.10)
+        self.assertTrue(baseline.sql_error_detected)
+
+        with patch("penetration_tester._detect_sql_error") as detect:
+            comparison = self.tester.compare_baseline_with_response(
+                baseline=baseline,
+                response=FakeResponse(body, 200),
+                response_time=0.12,
+            )
+
+        detect.assert_not_called()
+        self.assertEqual(comparison.similarity_ratio, 1.0)
+        self.assertEqual(comparison.content_length_delta, 0)
+        self.assertFalse(comparison.hash_changed)
+        self.assertTrue(comparison.sql_error_detected)
+
     def test_send_sqli_payloads_marks_likely_sqli(self) -> None:
         baseline_response = FakeResponse("<html>normal catalog page</html>", 200)
         injected_response = FakeResponse(
@@ -64,6 +86,30 @@ class PenetrationTesterTests(unittest.TestCase):
         self.assertTrue(results[0].likely_sqli)
         self.assertTrue(results[0].comparison.sql_error_detected)
 
+    def test_send_sqli_payloads_keeps_job_order(self) -> None:
+        # Earlier payloads answer last, so results cannot follow completion order.
+        delays = {"'": 0.03, "' OR 1=1--": 0.02, "') OR ('1'='1": 0.01}
+
+        def fake_send(*, url, method, params=None, data=None, headers=None):
+            delay = next(
+                (d for p, d in delays.items() if any(str(v).endswith(p) for v in params.values())),
+                0.0,
+            )
+            time.sleep(delay)
+            return FakeResponse("<html>normal</html>", 200), delay
+
+        with patch.object(PenetrationTester, "_send_request", side_effect=fake_send):
+            results = self.tester.send_sqli_payloads(
+                url="http://target.local/items",
+                params={"id": "1", "q": "a"},
+                payloads=list(delays),
+            )
+
+        self.assertEqual(
+            [(r.parameter, r.payload) for r in results],
+            [(param, payload) for param in ("id", "q") for payload in delays],
+        )
+
     def test_detect_time_based_blind_sqli(self) -> None:
         normal_response = FakeResponse("<html>ok</html>", 200)
 
@@ -90,6 +136,76 @@ class PenetrationTesterTests(unittest.TestCase):
         self.assertEqual(results[0].parameter, "id")
         self.assertTrue(results[0].likely_vulnerable)
         self.assertGreater(results[0].delay_delta, 2.0)
+        self.assertEqual(results[0].samples, 2)
+
+    def test_detect_time_based_blind_sqli_stops_early_on_fast_majority(self) -> None:
+        normal_response = FakeResponse("<html>ok</html>", 200)
+
+        # retries=3: 3 baseline calls, then two fast injected calls are a
+        # majority and end sampling before the third.
+        with patch.object(
+            PenetrationTester,
+            "_send_request",
+            side_effect=[
+                (normal_response, 0.10),
+                (normal_response, 0.12),
+                (normal_response, 0.11),
+                (normal_response, 0.12),
+                (normal_response, 0.13),
+            ],
+        ):
+            results = self.tester.detect_time_based_blind_sqli(
+                url="http://target.local/items",
+                params={"id": "1"},
+                payloads=["' AND SLEEP(5)--"],
+                retries=3,
+                min_delay_delta=2.0,
+            )
+
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0].likely_vulnerable)
+        self.assertEqual(results[0].samples, 2)
+
+    def test_detect_time_based_blind_sqli_survives_one_fast_sample(self) -> None:
+        normal_response = FakeResponse("<html>ok</html>", 200)
+
+        # One jittery fast response between two delayed ones must not end sampling.
+        with patch.object(
+            PenetrationTester,
+            "_send_request",
+            side_effect=[
+                (normal_response, 0.10),
+                (normal_response, 0.12),
+                (normal_response, 0.11),
+                (normal_response, 5.00),
+                (normal_response, 0.10),
+                (normal_response, 5.00),
+            ],
+        ):
+            results = self.tester.detect_time_based_blind_sqli(
+                url="http://target.local/items",
+                params={"id": "1"},
+                payloads=["' AND SLEEP(5)--"],
+                retries=3,
+                min_delay_delta=2.0,
+            )
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].likely_vulnerable)
+        self.assertEqual(results[0].samples, 3)
+        self.assertEqual(results[0].median_injected_time, 5.00)
+        self.assertAlmostEqual(results[0].average_injected_time, 10.10 / 3)
+
+    def test_close_closes_owned_session_only(self) -> None:
+        with patch("penetration_tester.requests.Session.close") as close:
+            with PenetrationTester(timeout=3):
+                pass
+        close.assert_called_once()
+
+        session = requests.Session()
+        with patch.object(session, "close") as close:
+            PenetrationTester(timeout=3, session=session).close()
+        close.assert_not_called()
 
 
 if __name__ == "__main__":